@@ -0,0 +1,20 @@
+"""
+Admin activity logging.
+
+Each AdminActivity row is written synchronously, inside whatever transaction the calling
+view has open, so the audit trail is durable and rolls back together with the action it
+records.
+"""
+from .decorators import get_client_ip
+
+
+def log_admin_activity(request, action, description):
+    """Record an AdminActivity for the requesting admin"""
+    from .models import AdminActivity
+
+    return AdminActivity.objects.create(
+        admin=request.user,
+        action=action,
+        description=description,
+        ip_address=get_client_ip(request)
+    )
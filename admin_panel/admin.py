@@ -3,6 +3,7 @@ from django.utils.html import format_html
 from django.urls import reverse
 from django.utils import timezone
 from .models import AdminActivity, AdminNotification
+from .decorators import get_client_ip
 from custom_auth.models import SellerApplication
 import json
 
@@ -82,7 +83,7 @@ class SellerApplicationAdmin(admin.ModelAdmin):
                 admin=request.user,
                 action='approve',
                 description=f'Approved seller application for {application.business_name}',
-                ip_address=request.META.get('REMOTE_ADDR')
+                ip_address=get_client_ip(request)
             )
             updated += 1
             
@@ -102,7 +103,7 @@ class SellerApplicationAdmin(admin.ModelAdmin):
                 admin=request.user,
                 action='reject',
                 description=f'Rejected seller application for {application.business_name}',
-                ip_address=request.META.get('REMOTE_ADDR')
+                ip_address=get_client_ip(request)
             )
             updated += 1
             
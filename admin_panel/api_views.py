@@ -3,45 +3,236 @@ from rest_framework.decorators import api_view, permission_classes, authenticati
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.authentication import SessionAuthentication, TokenAuthentication
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import PageNumberPagination, CursorPagination
+from rest_framework.exceptions import NotFound
 from django.utils import timezone
-from django.db.models import Count, Sum, Q, F
+from django.db.models import Count, Sum, Max, Q, F, Case, When, DateField, IntegerField, Prefetch, QuerySet
+from django.db.models.functions import TruncDate, TruncMonth
 from django.shortcuts import get_object_or_404
-from django.http import HttpResponse, JsonResponse
-from django.db import transaction
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.db import transaction, connections
+from django.core.paginator import Paginator, Page, PageNotAnInteger, EmptyPage
+from django.utils.functional import cached_property
 from django.conf import settings
-from django.views.decorators.http import require_http_methods
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.views.decorators.http import require_http_methods, condition
+from django.views.decorators.cache import cache_control
 from django.views.decorators.csrf import csrf_exempt
+from django.utils.decorators import method_decorator
+from django.utils.cache import get_conditional_response
 from django.contrib.auth.decorators import login_required
+from channels.db import database_sync_to_async
 import csv
+import hashlib
+import io
+import itertools
+import json
+import logging
+import os
+import time
+import traceback
+import uuid
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 
 from custom_auth.models import User, Artist, Store
-from products.models import Product, Category, Advertisement, ContentSettings, Tag, CategoryVariantOption, ProductVariant, ProductVariantOption, DiscountRequest, ProductImage
+from products.models import Product, Category, Advertisement, ContentSettings, Tag, CategoryVariantOption, ProductVariant, ProductVariantOption, DiscountRequest, ProductImage, ACTIVE_ADS_CACHE_KEY, ATTRIBUTES_VERSION_CACHE_KEY
+from products.models import (
+    CategoryVariantType, ProductCategoryVariantOption, ProductAttribute, ProductAttributeOption, ProductVariantAttribute,
+    CategoryAttribute, SellerOfferRequest, SellerFeaturedRequest, ProductOffer, FeaturedProduct
+)
 from orders.models import Order, OrderItem
 from notifications.models import Notification as UserNotification, Device, PushNotificationLog
 from notifications.serializers import NotificationSerializer
 from notifications.push_utils import send_notification_with_push
-from .models import AdminActivity, AdminNotification
+from .models import AdminActivity, AdminNotification, AdType, AdPricing, AdBookingRequest
+from .decorators import is_admin
+from .activity_log import log_admin_activity
 from custom_auth.models import SellerApplication
+from custom_auth.api_views import block_unblock_user
 from .serializers import (
     SellerApplicationSerializer, UserSerializer, ProductSerializer,
     OrderSerializer, AdminNotificationSerializer, SellerApplicationCreateSerializer
 )
 
-def get_client_ip(request):
-    """Get client IP address from request"""
-    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-    if x_forwarded_for:
-        ip = x_forwarded_for.split(',')[0]
-    else:
-        ip = request.META.get('REMOTE_ADDR')
-    return ip
+logger = logging.getLogger(__name__)
+
+# Form values that count as true when a boolean arrives as a string
+TRUTHY_STRINGS = frozenset({'true', '1', 'yes', 'on'})
+
+
+def parse_bool(value):
+    """Parse a boolean sent as a form string, JSON bool or other value"""
+    if isinstance(value, str):
+        return value.lower() in TRUTHY_STRINGS
+    return bool(value)
+
+
+def dump_json(data):
+    """Encode data as compact UTF-8 JSON bytes, byte-for-byte like UnicodeJSONRenderer"""
+    return json.dumps(data, cls=DjangoJSONEncoder, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def json_response(data, status=200):
+    """Return data as JSON directly, skipping DRF content negotiation and rendering"""
+    return HttpResponse(dump_json(data), status=status, content_type='application/json; charset=utf-8')
+
+# Table statistics queries per database vendor, used to estimate the row count of large tables
+ROW_ESTIMATE_SQL = {
+    'mysql': "SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+    'postgresql': "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+}
+
+def estimated_row_count(queryset):
+    """Return the planner's row estimate for an unfiltered queryset, or None when it can't be used"""
+    query = queryset.query
+    if query.where or query.distinct or query.combinator or query.low_mark or query.high_mark is not None:
+        return None
+    
+    connection = connections[queryset.db]
+    sql = ROW_ESTIMATE_SQL.get(connection.vendor)
+    if sql is None:
+        return None
+    
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [queryset.model._meta.db_table])
+        row = cursor.fetchone()
+    return int(row[0]) if row and row[0] is not None else None
+
+class LookaheadPage(Page):
+    """Page that knows whether another page follows without counting the whole list"""
+    
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+    
+    def has_next(self):
+        return self._has_next
+    
+    def next_page_number(self):
+        return self.number + 1
+    
+    def previous_page_number(self):
+        return self.number - 1
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that skips COUNT(*) on unfiltered large tables. Their total shown to clients
+    (display_count) is the table statistics estimate, while pages are served and validated
+    from the rows that actually exist by reading one row past the page.
+    Exact counts are cached briefly per query, so paging through a filtered list counts once.
+    """
+    estimate_threshold = 100000
+    count_cache_timeout = 60  # seconds
+    lookahead_page = None
+    
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet):
+            return super().count
+        
+        sql, params = self.object_list.query.sql_with_params()
+        cache_key = 'admin_count:' + hashlib.md5(repr((sql, params)).encode()).hexdigest()
+        return cache.get_or_set(cache_key, self.object_list.count, self.count_cache_timeout)
+    
+    @cached_property
+    def estimated_count(self):
+        """Table statistics row count for an unfiltered large table, otherwise None"""
+        if not isinstance(self.object_list, QuerySet):
+            return None
+        estimate = estimated_row_count(self.object_list)
+        if estimate is not None and estimate >= self.estimate_threshold:
+            return estimate
+        return None
+    
+    @property
+    def display_count(self):
+        """Total reported to clients; an estimate for unfiltered large tables"""
+        if self.estimated_count is not None:
+            return self.estimated_count
+        return self.count
+    
+    @property
+    def num_pages(self):
+        if self.estimated_count is None:
+            return super().num_pages
+        # Only the pages known to exist: up to the one read, plus the next if it has rows
+        if self.lookahead_page is None:
+            return 1
+        return self.lookahead_page.number + int(self.lookahead_page.has_next())
+    
+    def page(self, number):
+        if self.estimated_count is None:
+            return super().page(number)
+        
+        # The estimate may be off in either direction, so never derive page bounds from it
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger('That page number is not an integer')
+        if number < 1:
+            raise EmptyPage('That page number is less than 1')
+        
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage('That page contains no results')
+        self.lookahead_page = LookaheadPage(rows[:self.per_page], number, self, has_next=len(rows) > self.per_page)
+        return self.lookahead_page
 
 class AdminPagination(PageNumberPagination):
     """Custom pagination for admin API endpoints"""
+    django_paginator_class = EstimatedCountPaginator
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    
+    def get_page_number(self, request, paginator):
+        if paginator.estimated_count is None:
+            return super().get_page_number(request, paginator)
+        
+        page_number = request.query_params.get(self.page_query_param) or 1
+        if page_number in self.last_page_strings:
+            # Locating the last page would need the COUNT(*) the estimate is there to avoid
+            raise NotFound(self.invalid_page_message.format(
+                page_number=page_number, message='The last page is not available for estimated counts'
+            ))
+        return page_number
+    
+    def get_paginated_response(self, data):
+        return Response({
+            'count': self.page.paginator.display_count,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+class AdminCursorPagination(CursorPagination):
+    """Keyset pagination for admin API endpoints, constant cost at any page depth"""
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 100
+    ordering = '-created_at'
+
+class AdminListPaginationMixin:
+    """
+    Paginate admin list views by page number, or by cursor when the client sends ?cursor=
+    (empty for the first page, then the returned next/previous links).
+    """
+    pagination_class = AdminPagination
+    cursor_ordering = '-created_at'
+    
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            if AdminCursorPagination.cursor_query_param in self.request.query_params:
+                self._paginator = AdminCursorPagination()
+                self._paginator.ordering = self.cursor_ordering
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
 
 # Test endpoint for debugging authentication (secured)
 @api_view(['GET'])
@@ -58,14 +249,17 @@ def test_authentication(request):
     return Response(data)
 
 # Seller Application Views
-class SellerApplicationListView(generics.ListAPIView):
+class SellerApplicationListView(AdminListPaginationMixin, generics.ListAPIView):
     serializer_class = SellerApplicationSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
     pagination_class = AdminPagination
     
     def get_queryset(self):
         status_filter = self.request.query_params.get('status', None)
-        queryset = SellerApplication.objects.select_related('user', 'reviewed_by').all().order_by('-created_at')
+        # The serializer reads only names and emails from the joined users, never the password hash
+        queryset = SellerApplication.objects.select_related('user', 'reviewed_by').defer(
+            'user__password', 'reviewed_by__password'
+        ).order_by('-created_at')
         
         if status_filter and status_filter != 'all':
             queryset = queryset.filter(status=status_filter)
@@ -80,81 +274,53 @@ class SellerApplicationDetailView(generics.RetrieveAPIView):
 @api_view(['POST'])
 @permission_classes([IsAuthenticated, IsAdminUser])
 def approve_application(request, pk):
-    application = get_object_or_404(SellerApplication, pk=pk)
+    application = get_object_or_404(SellerApplication.objects.select_related('user'), pk=pk)
     action = request.data.get('approved', False)
     notes = request.data.get('notes', '')
     
-    # Process the application
-    application.status = 'approved' if action else 'rejected'
-    application.admin_notes = notes
-    application.reviewed_at = timezone.now()
-    application.reviewed_by = request.user
-    application.save()
-    
-    # Log admin activity
-    activity_action = 'approve_application' if action else 'reject_application'
-    AdminActivity.objects.create(
-        admin=request.user,
-        action=activity_action,
-        description=f"{'Approved' if action else 'Rejected'} seller application #{application.id} for {application.business_name}",
-        ip_address=request.META.get('REMOTE_ADDR')
-    )
-    
-    # If approved, update user type and create profile
-    if action:
-        with transaction.atomic():
+    with transaction.atomic():
+        # Process the application, writing only the reviewed columns
+        application.status = 'approved' if action else 'rejected'
+        application.admin_notes = notes
+        application.reviewed_at = timezone.now()
+        application.reviewed_by = request.user
+        application.save(update_fields=['status', 'admin_notes', 'reviewed_at', 'reviewed_by', 'updated_at'])
+        
+        # Log admin activity
+        activity_action = 'approve_application' if action else 'reject_application'
+        log_admin_activity(
+            request,
+            activity_action,
+            f"{'Approved' if action else 'Rejected'} seller application #{application.id} for {application.business_name}"
+        )
+        
+        # If approved, update user type and create or refresh the seller profile
+        if action:
             user = application.user
-            user.user_type = application.seller_type
-            user.save()
+            User.objects.filter(pk=user.pk).update(user_type=application.seller_type)
             
             if application.seller_type == 'artist':
-                # Use select_for_update to prevent race conditions
-                try:
-                    artist_profile = Artist.objects.select_for_update().get(user=user)
-                    # Update existing profile
-                    artist_profile.specialty = application.specialty or ''
-                    artist_profile.bio = application.description
-                    artist_profile.social_media = application.social_media
-                    artist_profile.is_verified = True
-                    if application.profile_picture:
-                        artist_profile.profile_picture = application.profile_picture
-                    artist_profile.save()
-                except Artist.DoesNotExist:
-                    # Create new profile if it doesn't exist
-                    Artist.objects.create(
-                        user=user,
-                        specialty=application.specialty or '',
-                        bio=application.description,
-                        social_media=application.social_media,
-                        profile_picture=application.profile_picture,
-                        is_verified=True
-                    )
+                defaults = {
+                    'specialty': application.specialty or '',
+                    'bio': application.description,
+                    'social_media': application.social_media,
+                    'is_verified': True,
+                }
+                if application.profile_picture:
+                    defaults['profile_picture'] = application.profile_picture
+                Artist.objects.update_or_create(user=user, defaults=defaults)
             elif application.seller_type == 'store':
-                # Use select_for_update to prevent race conditions
-                try:
-                    store_profile = Store.objects.select_for_update().get(user=user)
-                    # Update existing profile
-                    store_profile.store_name = application.business_name
-                    store_profile.tax_id = application.tax_id or ''
-                    store_profile.has_physical_store = application.has_physical_store
-                    store_profile.physical_address = application.physical_address or ''
-                    store_profile.social_media = application.social_media
-                    store_profile.is_verified = True
-                    if application.profile_picture:
-                        store_profile.logo = application.profile_picture
-                    store_profile.save()
-                except Store.DoesNotExist:
-                    # Create new profile if it doesn't exist
-                    Store.objects.create(
-                        user=user,
-                        store_name=application.business_name,
-                        tax_id=application.tax_id or '',
-                        has_physical_store=application.has_physical_store,
-                        physical_address=application.physical_address or '',
-                        social_media=application.social_media,
-                        logo=application.profile_picture,
-                        is_verified=True
-                    )
+                defaults = {
+                    'store_name': application.business_name,
+                    'tax_id': application.tax_id or '',
+                    'has_physical_store': application.has_physical_store,
+                    'physical_address': application.physical_address or '',
+                    'social_media': application.social_media,
+                    'is_verified': True,
+                }
+                if application.profile_picture:
+                    defaults['logo'] = application.profile_picture
+                Store.objects.update_or_create(user=user, defaults=defaults)
     
     return Response({
         'status': 'success',
@@ -162,8 +328,9 @@ def approve_application(request, pk):
     })
 
 # User Views
-class UserListView(generics.ListAPIView):
+class UserListView(AdminListPaginationMixin, generics.ListAPIView):
     serializer_class = UserSerializer
+    cursor_ordering = '-date_joined'
     permission_classes = [IsAuthenticated, IsAdminUser]
     pagination_class = AdminPagination
     
@@ -171,7 +338,10 @@ class UserListView(generics.ListAPIView):
         user_type = self.request.query_params.get('type', None)
         search_query = self.request.query_params.get('q', None)
         
-        queryset = User.objects.all().order_by('-date_joined')
+        # Join the blocking admins read by UserSerializer and leave out the password hash
+        queryset = User.objects.select_related('blocked_by', 'unblocked_by').defer(
+            'password', 'blocked_by__password', 'unblocked_by__password'
+        ).order_by('-date_joined')
         
         if user_type and user_type != 'all':
             queryset = queryset.filter(user_type=user_type)
@@ -197,12 +367,11 @@ def block_user(request, pk):
     API endpoint to block or unblock a user
     This is a wrapper around the custom_auth block_unblock_user API
     """
-    from custom_auth.api_views import block_unblock_user
     # Pass the request directly without modifying it
     return block_unblock_user(request, pk)
 
 # Product Views
-class ProductListView(generics.ListAPIView):
+class ProductListView(AdminListPaginationMixin, generics.ListAPIView):
     serializer_class = ProductSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
     pagination_class = AdminPagination
@@ -212,7 +381,15 @@ class ProductListView(generics.ListAPIView):
         status = self.request.query_params.get('status', None)
         search_query = self.request.query_params.get('q', None)
         
-        queryset = Product.objects.select_related('category', 'seller').all().order_by('-created_at')
+        # Join the seller profiles read by ProductSerializer.get_seller_name and skip unused columns
+        queryset = Product.objects.select_related(
+            'category', 'seller__artist_profile', 'seller__store_profile'
+        ).only(
+            'id', 'name', 'description', 'base_price', 'stock_quantity', 'combination_stocks',
+            'is_active', 'is_featured', 'approval_status', 'rejection_reason', 'created_at', 'updated_at',
+            'category__name', 'seller__email', 'seller__user_type',
+            'seller__artist_profile__specialty', 'seller__store_profile__store_name'
+        ).order_by('-created_at')
         
         if category_id and category_id != 'all':
             queryset = queryset.filter(category_id=category_id)
@@ -238,20 +415,15 @@ class ProductDetailView(generics.RetrieveUpdateAPIView):
 @api_view(['POST'])
 @permission_classes([IsAuthenticated, IsAdminUser])
 def toggle_product_status(request, pk):
-    product = get_object_or_404(Product, pk=pk)
+    product = get_object_or_404(Product.objects.only('id', 'name', 'is_active'), pk=pk)
     
-    # Toggle is_active status
+    # Toggle is_active status, writing only that column
     product.is_active = not product.is_active
-    product.save()
+    product.save(update_fields=['is_active', 'updated_at'])
     
     # Log admin activity
     action = 'activate' if product.is_active else 'deactivate'
-    AdminActivity.objects.create(
-        admin=request.user,
-        action='other',
-        description=f"{action.capitalize()}d product #{product.id} - {product.name}",
-        ip_address=request.META.get('REMOTE_ADDR')
-    )
+    log_admin_activity(request, 'other', f"{action.capitalize()}d product #{product.id} - {product.name}")
     
     return Response({
         'status': 'success',
@@ -260,7 +432,18 @@ def toggle_product_status(request, pk):
     })
 
 # Order Views
-class OrderListView(generics.ListAPIView):
+# Order items with just the columns OrderItemSerializer reads, product name joined in
+ORDER_ITEMS_FOR_SERIALIZER = OrderItem.objects.select_related('product').only(
+    'id', 'order', 'product', 'quantity', 'price', 'product__name'
+)
+
+# Order columns and buyer fields read by OrderSerializer
+ORDER_FIELDS_FOR_SERIALIZER = (
+    'id', 'status', 'shipping_address', 'shipping_cost', 'total_amount', 'payment_method',
+    'created_at', 'updated_at', 'user__email', 'user__first_name', 'user__last_name'
+)
+
+class OrderListView(AdminListPaginationMixin, generics.ListAPIView):
     serializer_class = OrderSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
     pagination_class = AdminPagination
@@ -269,81 +452,115 @@ class OrderListView(generics.ListAPIView):
         status = self.request.query_params.get('status', None)
         search_query = self.request.query_params.get('q', None)
         
-        queryset = Order.objects.select_related('user').prefetch_related('items__product').all().order_by('-created_at')
+        queryset = Order.objects.select_related('user').only(*ORDER_FIELDS_FOR_SERIALIZER).prefetch_related(
+            Prefetch('items', queryset=ORDER_ITEMS_FOR_SERIALIZER)
+        ).order_by('-created_at')
         
         if status and status != 'all':
             queryset = queryset.filter(status=status)
             
         if search_query:
-            queryset = queryset.filter(
-                Q(id__icontains=search_query) | 
-                Q(user__email__icontains=search_query)
-            )
+            # Match order numbers exactly so the primary key index is used instead of a LIKE over CAST(id)
+            search = Q(user__email__icontains=search_query)
+            if search_query.isdigit():
+                search |= Q(id=int(search_query))
+            queryset = queryset.filter(search)
             
         return queryset
 
 class OrderDetailView(generics.RetrieveAPIView):
-    queryset = Order.objects.all()
+    queryset = Order.objects.select_related('user').only(*ORDER_FIELDS_FOR_SERIALIZER).prefetch_related(
+        Prefetch('items', queryset=ORDER_ITEMS_FOR_SERIALIZER)
+    )
     serializer_class = OrderSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
 
 # Dashboard Stats
+STATS_CACHE_KEY = 'admin_stats'
+STATS_CACHE_TIMEOUT = 30  # seconds
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsAdminUser])
 def admin_stats(request):
-    # User stats
-    total_users = User.objects.count()
-    customer_count = User.objects.filter(user_type='customer').count()
-    artist_count = User.objects.filter(user_type='artist').count()
-    store_count = User.objects.filter(user_type='store').count()
-    
-    # Order stats
-    total_orders = Order.objects.count()
-    pending_orders = Order.objects.filter(status='pending').count()
-    completed_orders = Order.objects.filter(status='completed').count()
-    
-    # Product stats
-    total_products = Product.objects.count()
-    active_products = Product.objects.filter(is_active=True).count()
-    
-    # Application stats
-    pending_applications = SellerApplication.objects.filter(status='pending').count()
+    # The dashboard polls these counters and they are the same for every admin,
+    # so serve them from the cache for a short while
+    data = cache.get(STATS_CACHE_KEY)
+    if data is None:
+        data = build_admin_stats()
+        cache.set(STATS_CACHE_KEY, data, timeout=STATS_CACHE_TIMEOUT)
     
-    # Revenue stats (assuming there's a total_amount field in Order)
-    total_revenue = Order.objects.filter(status='completed').aggregate(Sum('total_amount'))['total_amount__sum'] or 0
+    return Response(data)
+
+
+def build_admin_stats():
+    """Aggregate the dashboard counters"""
+    # One conditional aggregate per table instead of a query per counter
+    user_stats = User.objects.aggregate(
+        total=Count('id'),
+        customers=Count('id', filter=Q(user_type='customer')),
+        artists=Count('id', filter=Q(user_type='artist')),
+        stores=Count('id', filter=Q(user_type='store')),
+    )
+    order_stats = Order.objects.aggregate(
+        total=Count('id'),
+        pending=Count('id', filter=Q(status='pending')),
+        completed=Count('id', filter=Q(status='completed')),
+        revenue=Sum('total_amount', filter=Q(status='completed')),
+    )
+    product_stats = Product.objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(is_active=True)),
+    )
+    pending_applications = SellerApplication.objects.filter(status='pending').count()
     
     data = {
         'users': {
-            'total': total_users,
-            'customers': customer_count,
-            'artists': artist_count,
-            'stores': store_count
+            'total': user_stats['total'],
+            'customers': user_stats['customers'],
+            'artists': user_stats['artists'],
+            'stores': user_stats['stores']
         },
         'orders': {
-            'total': total_orders,
-            'pending': pending_orders,
-            'completed': completed_orders
+            'total': order_stats['total'],
+            'pending': order_stats['pending'],
+            'completed': order_stats['completed']
         },
         'products': {
-            'total': total_products,
-            'active': active_products
+            'total': product_stats['total'],
+            'active': product_stats['active']
         },
         'applications': {
             'pending': pending_applications
         },
         'revenue': {
-            'total': total_revenue
+            'total': order_stats['revenue'] or 0
         }
     }
     
-    return Response(data)
+    return data
 
 # Notification Views
-class AdminNotificationListView(generics.ListAPIView):
+def _admin_notifications_etag(request, *args, **kwargs):
+    """Weak ETag for the notification list, changing when notifications are added, removed or read"""
+    state = AdminNotification.objects.aggregate(
+        count=Count('id'),
+        unread=Count('id', filter=Q(is_read=False)),
+        latest=Max('created_at'),
+    )
+    state = repr((request.GET.urlencode(), sorted(state.items())))
+    return 'W/"%s"' % hashlib.md5(state.encode()).hexdigest()
+
+
+class AdminNotificationListView(AdminListPaginationMixin, generics.ListAPIView):
     serializer_class = AdminNotificationSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
     pagination_class = AdminPagination
     
+    # The admin panel polls this list; unchanged polls get a 304 without a page query
+    @method_decorator(condition(etag_func=_admin_notifications_etag))
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+    
     def get_queryset(self):
         is_read = self.request.query_params.get('is_read', None)
         queryset = AdminNotification.objects.all().order_by('-created_at')
@@ -357,26 +574,29 @@ class AdminNotificationListView(generics.ListAPIView):
 @api_view(['POST'])
 @permission_classes([IsAuthenticated, IsAdminUser])
 def mark_notification_read(request, pk):
-    notification = get_object_or_404(AdminNotification, pk=pk)
-    notification.is_read = True
-    notification.save()
+    # Single UPDATE; only look the row up when nothing changed to tell "already read" from missing
+    updated = AdminNotification.objects.filter(pk=pk, is_read=False).update(is_read=True)
+    if not updated and not AdminNotification.objects.filter(pk=pk).exists():
+        raise Http404('No AdminNotification matches the given query.')
     
     return Response({'status': 'success'})
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated, IsAdminUser])
 def mark_all_notifications_read(request):
-    AdminNotification.objects.filter(is_read=False).update(is_read=True)
+    updated = AdminNotification.objects.filter(is_read=False).update(is_read=True)
     
-    return Response({'status': 'success'})
+    return Response({'status': 'success', 'count': updated})
 
 # Report API Views
+REPORT_CACHE_TIMEOUT = 60  # seconds
+TOP_N_CACHE_TIMEOUT = 15 * 60  # seconds; top-N rankings scan every order item in the range
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def report_summary(request):
     """API endpoint to get summary report data"""
     # Check if user is admin
-    from .decorators import is_admin
     if not is_admin(request.user):
         return Response({'error': 'Admin access required'}, status=403)
     
@@ -389,35 +609,42 @@ def report_summary(request):
         # Calculate date range
         if start_date and end_date:
             # Custom date range
-            start = timezone.datetime.strptime(start_date, '%Y-%m-%d').date()
-            end = timezone.datetime.strptime(end_date, '%Y-%m-%d').date()
+            start = date.fromisoformat(start_date)
+            end = date.fromisoformat(end_date)
         else:
             # Days based range
             days = int(days)
             end = timezone.now().date()
-            start = end - timezone.timedelta(days=days)
+            start = end - timedelta(days=days)
     except (ValueError, TypeError):
         return Response(
             {'error': 'Invalid date parameters'}, 
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    # Sales data
-    total_orders = Order.objects.filter(created_at__date__range=(start, end)).count()
-    completed_orders = Order.objects.filter(
-        created_at__date__range=(start, end),
-        status='completed'
-    ).count()
-    
-    # Calculate total revenue
-    revenue_data = Order.objects.filter(
-        created_at__date__range=(start, end),
-        status='completed'
+    # Dashboards poll this report, so share the aggregates briefly per date range
+    cache_key = f"report_summary:{start.isoformat()}:{end.isoformat()}"
+    report_data = cache.get(cache_key)
+    if report_data is None:
+        report_data = build_report_summary(start, end)
+        cache.set(cache_key, report_data, timeout=REPORT_CACHE_TIMEOUT)
+    
+    return Response(report_data)
+
+
+def build_report_summary(start, end):
+    """Aggregate the summary report data for the given date range"""
+    # Sales data: order counts and completed revenue in one aggregate
+    sales_totals = Order.objects.filter(
+        created_at__date__range=(start, end)
     ).aggregate(
-        total_revenue=Sum('total_amount')
+        total_orders=Count('id'),
+        completed_orders=Count('id', filter=Q(status='completed')),
+        total_revenue=Sum('total_amount', filter=Q(status='completed'))
     )
-    
-    total_revenue = revenue_data['total_revenue'] or 0
+    total_orders = sales_totals['total_orders']
+    completed_orders = sales_totals['completed_orders']
+    total_revenue = sales_totals['total_revenue'] or 0
     
     # Calculate average order value
     avg_order_value = total_revenue / completed_orders if completed_orders > 0 else 0
@@ -425,25 +652,29 @@ def report_summary(request):
     # Calculate conversion rate (simplified)
     conversion_rate = (completed_orders / total_orders * 100) if total_orders > 0 else 0
     
-    # Generate daily sales data
+    # Generate daily sales data from one GROUP BY, filling days without orders
+    daily_sales = {
+        row['day']: row
+        for row in Order.objects.filter(
+            created_at__date__range=(start, end)
+        ).annotate(
+            day=TruncDate('created_at')
+        ).values('day').annotate(
+            orders=Count('id'),
+            revenue=Sum('total_amount', filter=Q(status='completed'))
+        ).order_by('day')
+    }
     daily_data = []
     current_date = start
     while current_date <= end:
-        day_orders = Order.objects.filter(created_at__date=current_date).count()
-        day_revenue = Order.objects.filter(
-            created_at__date=current_date,
-            status='completed'
-        ).aggregate(
-            revenue=Sum('total_amount')
-        )['revenue'] or 0
-        
+        day_sales = daily_sales.get(current_date, {})
         daily_data.append({
             'date': current_date.strftime('%Y-%m-%d'),
-            'orders': day_orders,
-            'revenue': day_revenue
+            'orders': day_sales.get('orders', 0),
+            'revenue': day_sales.get('revenue') or 0
         })
         
-        current_date += timezone.timedelta(days=1)
+        current_date += timedelta(days=1)
     
     # Order status distribution
     status_counts = Order.objects.filter(
@@ -454,93 +685,71 @@ def report_summary(request):
     
     status_distribution = {item['status']: item['count'] for item in status_counts}
     
-    # Monthly revenue data
-    monthly_revenue = []
+    # Monthly revenue data for the six full months before the end date, in one GROUP BY
+    months = []
+    month_end = end.replace(day=1) - timedelta(days=1)
     for i in range(6):
-        month_end = end.replace(day=1) - timezone.timedelta(days=1)
         month_start = month_end.replace(day=1)
-        
-        month_revenue = Order.objects.filter(
-            created_at__date__range=(month_start, month_end),
+        months.append(month_start)
+        month_end = month_start - timedelta(days=1)
+    months.reverse()
+    
+    revenue_by_month = dict(
+        Order.objects.filter(
+            created_at__date__range=(months[0], end.replace(day=1) - timedelta(days=1)),
             status='completed'
-        ).aggregate(
+        ).annotate(
+            month=TruncMonth('created_at', output_field=DateField())
+        ).values_list('month').annotate(
             revenue=Sum('total_amount')
-        )['revenue'] or 0
-        
-        monthly_revenue.append({
+        ).order_by('month')
+    )
+    monthly_revenue = [
+        {
             'month': month_start.strftime('%b %Y'),
-            'revenue': month_revenue
-        })
-        
-        end = month_start - timezone.timedelta(days=1)
-    
-    monthly_revenue.reverse()
-    
-    # User data
-    total_users = User.objects.count()
-    new_users = User.objects.filter(date_joined__date__range=(start, end)).count()
-    customer_count = User.objects.filter(user_type='customer').count()
-    artist_count = User.objects.filter(user_type='artist').count()
-    store_count = User.objects.filter(user_type='store').count()
+            'revenue': revenue_by_month.get(month_start) or 0
+        }
+        for month_start in months
+    ]
     
-    # User growth data
+    # User data in one conditional aggregate
+    user_stats = User.objects.aggregate(
+        total=Count('id'),
+        new=Count('id', filter=Q(date_joined__date__range=(start, end))),
+        customers=Count('id', filter=Q(user_type='customer')),
+        artists=Count('id', filter=Q(user_type='artist')),
+        stores=Count('id', filter=Q(user_type='store')),
+    )
+    total_users = user_stats['total']
+    new_users = user_stats['new']
+    customer_count = user_stats['customers']
+    artist_count = user_stats['artists']
+    store_count = user_stats['stores']
+    
+    # User growth data from one GROUP BY, filling days without sign-ups
+    daily_users = dict(
+        User.objects.filter(
+            date_joined__date__range=(start, end)
+        ).annotate(
+            day=TruncDate('date_joined')
+        ).values_list('day').annotate(
+            count=Count('id')
+        ).order_by('day')
+    )
     user_growth_data = []
     current_date = start
     while current_date <= end:
-        day_users = User.objects.filter(date_joined__date=current_date).count()
-        
         user_growth_data.append({
             'date': current_date.strftime('%Y-%m-%d'),
-            'count': day_users
+            'count': daily_users.get(current_date, 0)
         })
         
-        current_date += timezone.timedelta(days=1)
-    
-    # Product data
-    # Top selling products with optimized queries
-    top_products = Product.objects.select_related('category', 'seller').annotate(
-        units_sold=Count('orderitem')
-    ).order_by('-units_sold')[:10]
-    
-    top_products_data = []
-    for product in top_products:
-        revenue = OrderItem.objects.filter(
-            product=product,
-            order__created_at__date__range=(start, end),
-            order__status='completed'
-        ).aggregate(
-            revenue=Sum(F('price') * F('quantity'))
-        )['revenue'] or 0
-        
-        top_products_data.append({
-            'id': product.id,
-            'name': product.name,
-            'category': product.category.name if product.category else 'Uncategorized',
-            'units_sold': product.units_sold,
-            'revenue': revenue
-        })
-    
-    # Top categories with optimized queries
-    top_categories = Category.objects.prefetch_related('products').annotate(
-        product_count=Count('products')
-    ).order_by('-product_count')[:5]
+        current_date += timedelta(days=1)
     
-    top_categories_data = []
-    for category in top_categories:
-        category_revenue = OrderItem.objects.filter(
-            product__category=category,
-            order__created_at__date__range=(start, end),
-            order__status='completed'
-        ).aggregate(
-            revenue=Sum(F('price') * F('quantity'))
-        )['revenue'] or 0
-        
-        top_categories_data.append({
-            'id': category.id,
-            'name': category.name,
-            'product_count': category.product_count,
-            'revenue': category_revenue
-        })
+    # Product data: the top-N scans over order items change slowly, so they are
+    # cached longer than the rest of the report
+    top_products_data = get_top_products(start, end)
+    top_categories_data = get_top_categories(start, end)
     
     # Combine all data
     report_data = {
@@ -568,7 +777,81 @@ def report_summary(request):
         }
     }
     
-    return Response(report_data)
+    return report_data
+
+
+def get_top_products(start, end):
+    """Top selling products for the date range, cached for TOP_N_CACHE_TIMEOUT"""
+    return cache.get_or_set(
+        f"report_top_products:{start.isoformat()}:{end.isoformat()}",
+        lambda: compute_top_products(start, end),
+        timeout=TOP_N_CACHE_TIMEOUT
+    )
+
+
+def get_top_categories(start, end):
+    """Top categories for the date range, cached for TOP_N_CACHE_TIMEOUT"""
+    return cache.get_or_set(
+        f"report_top_categories:{start.isoformat()}:{end.isoformat()}",
+        lambda: compute_top_categories(start, end),
+        timeout=TOP_N_CACHE_TIMEOUT
+    )
+
+
+def compute_top_products(start, end):
+    """Top selling products, with their revenue in the report period, in one query"""
+    completed_in_period = Q(
+        orderitem__order__created_at__date__range=(start, end),
+        orderitem__order__status='completed'
+    )
+    top_products = Product.objects.values('id', 'name', 'category__name').annotate(
+        units_sold=Count('orderitem'),
+        revenue=Sum(F('orderitem__price') * F('orderitem__quantity'), filter=completed_in_period)
+    ).order_by('-units_sold')[:10]
+    
+    top_products_data = []
+    for product in top_products:
+        revenue = product['revenue'] or 0
+        
+        top_products_data.append({
+            'id': product['id'],
+            'name': product['name'],
+            'category': product['category__name'] or 'Uncategorized',
+            'units_sold': product['units_sold'],
+            'revenue': revenue
+        })
+    
+    return top_products_data
+
+
+def compute_top_categories(start, end):
+    """Top categories with their revenue in the report period in one query
+
+    The order item join repeats product rows, so products are counted distinctly.
+    """
+    top_categories = Category.objects.values('id', 'name').annotate(
+        product_count=Count('products', distinct=True),
+        revenue=Sum(
+            F('products__orderitem__price') * F('products__orderitem__quantity'),
+            filter=Q(
+                products__orderitem__order__created_at__date__range=(start, end),
+                products__orderitem__order__status='completed'
+            )
+        )
+    ).order_by('-product_count')[:5]
+    
+    top_categories_data = []
+    for category in top_categories:
+        category_revenue = category['revenue'] or 0
+        
+        top_categories_data.append({
+            'id': category['id'],
+            'name': category['name'],
+            'product_count': category['product_count'],
+            'revenue': category_revenue
+        })
+    
+    return top_categories_data
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsAdminUser])
@@ -601,88 +884,85 @@ def update_settings(request, setting_type):
     # In a real application, you would save these settings to the database
     
     # Log admin activity
-    AdminActivity.objects.create(
-        admin=request.user,
-        action='other',
-        description=f"Updated {setting_type} settings",
-        ip_address=request.META.get('REMOTE_ADDR')
-    )
+    log_admin_activity(request, 'other', f"Updated {setting_type} settings")
     
     return Response({
         'status': 'success',
         'message': f'{setting_type.capitalize()} settings updated successfully'
     })
 
+# Default settings for demonstration; static, so built once at import
+DEFAULT_SETTINGS = MappingProxyType({
+    'general': {
+        'site_name': 'To7fa',
+        'site_description': 'Your one-stop shop for handmade gifts and crafts',
+        'contact_email': 'contact@to7fa.com',
+        'contact_phone': '+1 (555) 123-4567',
+        'address': '123 Main Street, Cairo, Egypt',
+        'currency': 'USD',
+        'timezone': 'UTC',
+        'maintenance_mode': False
+    },
+    'notifications': {
+        'new_order_notification': True,
+        'new_user_notification': True,
+        'new_seller_application_notification': True,
+        'low_stock_notification': True,
+        'low_stock_threshold': 5,
+        'order_status_notification': True,
+        'promotional_notification': True
+    },
+    'api': {
+        'enable_api': True,
+        'api_rate_limit': 60,
+        'api_token_expiry': 30,
+        'enable_cors': True,
+        'allowed_origins': 'https://to7fa.com\nhttps://www.to7fa.com\nhttp://localhost:3000'
+    },
+    'email': {
+        'email_provider': 'smtp',
+        'smtp_host': 'smtp.gmail.com',
+        'smtp_port': 587,
+        'smtp_encryption': 'tls',
+        'smtp_username': 'noreply@to7fa.com',
+        'from_name': 'To7fa',
+        'from_email': 'noreply@to7fa.com'
+    },
+    'payment': {
+        'enable_stripe': True,
+        'stripe_test_mode': True,
+        'enable_paypal': True,
+        'paypal_sandbox': True,
+        'enable_cod': True,
+        'cod_fee': 5
+    },
+    'security': {
+        'session_timeout': 30,
+        'max_login_attempts': 5,
+        'lockout_duration': 15,
+        'enforce_strong_passwords': True,
+        'enable_two_factor': False,
+        'enable_captcha': True
+    }
+})
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsAdminUser])
 def get_settings(request, setting_type):
     """API endpoint to get settings"""
     # This is a simplified implementation
     # In a real application, you would retrieve these settings from the database
-    
-    # Default settings for demonstration
-    settings_data = {
-        'general': {
-            'site_name': 'To7fa',
-            'site_description': 'Your one-stop shop for handmade gifts and crafts',
-            'contact_email': 'contact@to7fa.com',
-            'contact_phone': '+1 (555) 123-4567',
-            'address': '123 Main Street, Cairo, Egypt',
-            'currency': 'USD',
-            'timezone': 'UTC',
-            'maintenance_mode': False
-        },
-        'notifications': {
-            'new_order_notification': True,
-            'new_user_notification': True,
-            'new_seller_application_notification': True,
-            'low_stock_notification': True,
-            'low_stock_threshold': 5,
-            'order_status_notification': True,
-            'promotional_notification': True
-        },
-        'api': {
-            'enable_api': True,
-            'api_rate_limit': 60,
-            'api_token_expiry': 30,
-            'enable_cors': True,
-            'allowed_origins': 'https://to7fa.com\nhttps://www.to7fa.com\nhttp://localhost:3000'
-        },
-        'email': {
-            'email_provider': 'smtp',
-            'smtp_host': 'smtp.gmail.com',
-            'smtp_port': 587,
-            'smtp_encryption': 'tls',
-            'smtp_username': 'noreply@to7fa.com',
-            'from_name': 'To7fa',
-            'from_email': 'noreply@to7fa.com'
-        },
-        'payment': {
-            'enable_stripe': True,
-            'stripe_test_mode': True,
-            'enable_paypal': True,
-            'paypal_sandbox': True,
-            'enable_cod': True,
-            'cod_fee': 5
-        },
-        'security': {
-            'session_timeout': 30,
-            'max_login_attempts': 5,
-            'lockout_duration': 15,
-            'enforce_strong_passwords': True,
-            'enable_two_factor': False,
-            'enable_captcha': True
-        }
-    }
-    
-    if setting_type in settings_data:
-        return Response(settings_data[setting_type])
+    if setting_type in DEFAULT_SETTINGS:
+        return Response(DEFAULT_SETTINGS[setting_type])
     else:
         return Response(
             {'error': f'Settings type "{setting_type}" not found'}, 
             status=status.HTTP_404_NOT_FOUND
         )
 
+CSV_EXPORT_CHUNK_SIZE = 2000
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsAdminUser])
 def export_activity_log(request):
@@ -702,111 +982,217 @@ def export_activity_log(request):
     if action_type:
         activities = activities.filter(action=action_type)
     
-    if date_from:
-        date_from = timezone.datetime.strptime(date_from, '%Y-%m-%d').date()
-        activities = activities.filter(timestamp__date__gte=date_from)
-    
-    if date_to:
-        date_to = timezone.datetime.strptime(date_to, '%Y-%m-%d').date()
-        activities = activities.filter(timestamp__date__lte=date_to)
+    try:
+        if date_from:
+            activities = activities.filter(timestamp__date__gte=date.fromisoformat(date_from))
+        
+        if date_to:
+            activities = activities.filter(timestamp__date__lte=date.fromisoformat(date_to))
+    except ValueError:
+        return Response(
+            {'error': 'Invalid date parameters'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
     
-    # Create CSV response
-    response = HttpResponse(content_type='text/csv')
+    # Plain tuples instead of model instances, with the action labels resolved from a dict.
+    # Newest first by id, which follows the auto_now_add timestamp and pages on the primary key
+    activities = activities.order_by('-id').values_list(
+        'id', 'admin__email', 'action', 'description', 'ip_address', 'timestamp'
+    )
+    action_labels = dict(AdminActivity._meta.get_field('action').flatchoices)
+    
+    @database_sync_to_async
+    def fetch_chunk(before_id):
+        chunk = activities.filter(id__lt=before_id) if before_id else activities
+        return list(chunk[:CSV_EXPORT_CHUNK_SIZE])
+    
+    # Async so uvicorn streams it chunk by chunk; a sync iterator would be buffered whole
+    async def chunks():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(['Admin', 'Action', 'Description', 'IP Address', 'Timestamp'])
+        before_id = None
+        while True:
+            rows = await fetch_chunk(before_id)
+            for activity_id, email, action, description, ip_address, timestamp in rows:
+                writer.writerow([
+                    email,
+                    action_labels.get(action, action),
+                    description,
+                    ip_address,
+                    timestamp.strftime('%Y-%m-%d %H:%M:%S')
+                ])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            if len(rows) < CSV_EXPORT_CHUNK_SIZE:
+                break
+            before_id = rows[-1][0]
+    
+    response = StreamingHttpResponse(chunks(), content_type='text/csv')
     response['Content-Disposition'] = 'attachment; filename="activity_log.csv"'
-    
-    # Create CSV writer
-    writer = csv.writer(response)
-    writer.writerow(['Admin', 'Action', 'Description', 'IP Address', 'Timestamp'])
-    
-    # Add data rows
-    for activity in activities:
-        writer.writerow([
-            activity.admin.email,
-            activity.get_action_display(),
-            activity.description,
-            activity.ip_address,
-            activity.timestamp.strftime('%Y-%m-%d %H:%M:%S')
-        ])
-    
     return response
 
 @api_view(['GET'])
 @permission_classes([])  # Allow any user to access ads
 def get_active_ads(request):
-    """API endpoint to get active advertisements"""
-    from products.models import Advertisement, ContentSettings
+    """API endpoint to get active advertisements.
+
+    The encoded JSON body and its ETag are cached per
+    ContentSettings.cache_duration and cleared by the products signals
+    whenever an ad or the content settings change, so cache hits skip
+    serialization and DRF rendering entirely, and unchanged polls get a 304.
+    """
+    cached = cache.get(ACTIVE_ADS_CACHE_KEY)
+    if cached is not None:
+        return _active_ads_response(request, *cached)
     
     # Get settings to check if ads should be shown
     settings = ContentSettings.get_settings()
     if not settings.show_ads_slider:
-        return Response({
+        payload = {
             'results': [],
             'count': 0,
             'message': 'Ads slider is currently disabled'
-        })
-    
-    # Get active ads ordered by display order
-    ads = Advertisement.objects.filter(
-        is_active=True
-    ).order_by('order', '-created_at')[:settings.max_ads_to_show]
+        }
+    else:
+        # Get active ads ordered by display order, reading only the columns the slider needs
+        ads = Advertisement.objects.filter(
+            is_active=True
+        ).order_by('order', '-created_at').values(
+            'id', 'title', 'description', 'image', 'image_url', 'link_url', 'order', 'created_at'
+        )[:settings.max_ads_to_show]
+        image_storage = Advertisement._meta.get_field('image').storage
+        
+        ads_data = []
+        for ad in ads:
+            ads_data.append({
+                'id': ad['id'],
+                'title': ad['title'],
+                'description': ad['description'],
+                # Same precedence as Advertisement.image_display_url: external URL first
+                'image': ad['image_url'] or (image_storage.url(ad['image']) if ad['image'] else None),
+                'linkUrl': ad['link_url'],
+                'order': ad['order'],
+                'createdAt': ad['created_at'].isoformat()
+            })
+        
+        payload = {
+            'results': ads_data,
+            'count': len(ads_data),
+            'settings': {
+                'max_ads': settings.max_ads_to_show,
+                'rotation_interval': settings.ads_rotation_interval,
+                'refresh_interval': settings.content_refresh_interval
+            }
+        }
     
-    ads_data = []
-    for ad in ads:
-        ads_data.append({
-            'id': ad.id,
-            'title': ad.title,
-            'description': ad.description,
-            'image': ad.image_display_url,
-            'linkUrl': ad.link_url,
-            'order': ad.order,
-            'createdAt': ad.created_at.isoformat()
-        })
+    body = dump_json(payload)
+    etag = '"%s"' % hashlib.md5(body).hexdigest()
+    if settings.enable_content_cache:
+        cache.set(ACTIVE_ADS_CACHE_KEY, (etag, body), timeout=settings.cache_duration * 60)
     
-    return Response({
-        'results': ads_data,
-        'count': len(ads_data),
-        'settings': {
-            'max_ads': settings.max_ads_to_show,
-            'rotation_interval': settings.ads_rotation_interval,
-            'refresh_interval': settings.content_refresh_interval
-        }
-    })
+    return _active_ads_response(request, etag, body)
+
+
+def _active_ads_response(request, etag, body):
+    """Serve the encoded ads body, or a 304 when the client already has this version"""
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = HttpResponse(body, content_type='application/json; charset=utf-8')
+    response['ETag'] = etag
+    return response
 
 
 # Product with Variants API
+ALLOWED_IMAGE_TYPES = frozenset({'image/jpeg', 'image/png', 'image/webp', 'image/gif'})
+ALLOWED_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.webp', '.gif'})
+MAX_IMAGE_SIZE = 5 * 1024 * 1024  # 5MB
+IMAGE_SIGNATURES = (
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+)
+
+def sniff_image_type(file):
+    """Return the image MIME type from the file's leading bytes, or None if unrecognized"""
+    header = file.read(12)
+    file.seek(0)
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'image/webp'
+    for signature, content_type in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return content_type
+    return None
+
 def validate_uploaded_files(files):
     """Validate uploaded image files"""
-    allowed_types = ['image/jpeg', 'image/png', 'image/webp', 'image/gif']
-    max_file_size = 5 * 1024 * 1024  # 5MB
-    
     errors = []
     
     for file in files:
-        # Check file type
-        if file.content_type not in allowed_types:
+        # Check file type from its content rather than the client-supplied content type
+        if sniff_image_type(file) not in ALLOWED_IMAGE_TYPES:
             errors.append(f"File '{file.name}' has invalid type. Allowed types: JPEG, PNG, WebP, GIF")
         
         # Check file size
-        if file.size > max_file_size:
+        if file.size > MAX_IMAGE_SIZE:
             errors.append(f"File '{file.name}' is too large. Maximum size: 5MB")
         
         # Check file extension
-        allowed_extensions = ['.jpg', '.jpeg', '.png', '.webp', '.gif']
-        if not any(file.name.lower().endswith(ext) for ext in allowed_extensions):
+        if os.path.splitext(file.name)[1].lower() not in ALLOWED_IMAGE_EXTENSIONS:
             errors.append(f"File '{file.name}' has invalid extension")
     
     return errors
 
+def parse_variant_entries(variants_data):
+    """
+    Parse each variants_data entry once into an (option_id, entry, stock_count, price_adjustment)
+    tuple, skipping entries with a missing or malformed option id, stock count or price adjustment.
+    """
+    rows = []
+    for entry in variants_data:
+        try:
+            rows.append((
+                int(entry.get('option_id')),
+                entry,
+                int(entry.get('stock_count', 0)),
+                float(entry.get('price_adjustment', 0))
+            ))
+        except (AttributeError, TypeError, ValueError):
+            continue
+    return rows
+
+def fetch_category_variant_options(option_ids):
+    """Load the given CategoryVariantOptions in one query, keyed by id"""
+    return CategoryVariantOption.objects.select_related('variant_type').in_bulk(set(option_ids))
+
+def ensure_category_variant_types(category, variant_types):
+    """Give the category a variant type named like each of variant_types that it lacks"""
+    existing_names = set(category.variant_types.values_list('name', flat=True))
+    missing = {}
+    for variant_type in variant_types:
+        if variant_type.name not in existing_names:
+            missing.setdefault(variant_type.name, variant_type)
+    CategoryVariantType.objects.bulk_create([
+        CategoryVariantType(category=category, name=name, is_required=variant_type.is_required)
+        for name, variant_type in missing.items()
+    ], ignore_conflicts=True)
+
+def save_uploaded_images(files):
+    """Write uploaded product images to storage in parallel and return their stored names"""
+    image_field = ProductImage._meta.get_field('image')
+
+    def save_file(file):
+        return image_field.storage.save(image_field.generate_filename(None, file.name), file)
+
+    with ThreadPoolExecutor(max_workers=min(len(files), 8)) as executor:
+        return list(executor.map(save_file, files))
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated, IsAdminUser])
 def create_product_with_variants(request):
     """API endpoint to create a product with variants"""
-    from products.models import (
-        Product, ProductImage, CategoryVariantOption, ProductCategoryVariantOption
-    )
-    from django.db import transaction
-    import json
-    
     # Validate uploaded files first
     images = request.FILES.getlist('images')
     if images:
@@ -828,16 +1214,13 @@ def create_product_with_variants(request):
             
             
             # Validation
-            # print(f"Starting validation...")
             if not name:
-                # print(f"VALIDATION FAILED: Product name is empty")
                 return Response({
                     'status': 'error',
                     'error': 'Product name is required'
                 }, status=status.HTTP_400_BAD_REQUEST)
             
             if not description:
-                print(f"VALIDATION FAILED: Product description is empty")
                 return Response({
                     'status': 'error',
                     'error': 'Product description is required'
@@ -847,9 +1230,7 @@ def create_product_with_variants(request):
                 base_price = float(base_price)
                 if base_price < 0:
                     raise ValueError("Price cannot be negative")
-                print(f"VALIDATION PASSED: base_price = {base_price}")
-            except (TypeError, ValueError) as e:
-                print(f"VALIDATION FAILED: base_price error - {e}")
+            except (TypeError, ValueError):
                 return Response({
                     'status': 'error',
                     'error': 'Valid base price is required'
@@ -857,18 +1238,14 @@ def create_product_with_variants(request):
             
             try:
                 category_id = int(category_id)
-                print(f"VALIDATION PASSED: category_id = {category_id}")
-            except (TypeError, ValueError) as e:
-                print(f"VALIDATION FAILED: category_id error - {e}")
+            except (TypeError, ValueError):
                 return Response({
                     'status': 'error',
                     'error': 'Valid category is required'
                 }, status=status.HTTP_400_BAD_REQUEST)
             
             # Handle boolean conversion
-            is_featured = request.data.get('is_featured', False)
-            if isinstance(is_featured, str):
-                is_featured = is_featured.lower() in ('true', '1', 'yes', 'on')
+            is_featured = parse_bool(request.data.get('is_featured', False))
             
             # Get stock quantity (default to 0 if not provided)
             stock_quantity = request.data.get('stock_quantity', 0)
@@ -877,156 +1254,85 @@ def create_product_with_variants(request):
             except (ValueError, TypeError):
                 stock_quantity = 0
                 
+            # Parse variants data from frontend
+            variants_data_str = request.data.get('variants_data', '[]')
+            
+            try:
+                variants_data = json.loads(variants_data_str) if variants_data_str else []
+            except json.JSONDecodeError as e:
+                logger.debug("Ignoring malformed variants_data: %s", e)
+                variants_data = []
+            
+            # Resolve the variant rows before creating the product, so combination_stocks
+            # goes into the initial INSERT instead of a follow-up UPDATE
+            product_variants = {}  # a repeated option keeps its first position and its last values
+            combination_stocks = {}  # For Flutter app compatibility
+            
+            if variants_data:
+                # Parse every entry once, then load every referenced option in one query
+                variant_rows = parse_variant_entries(variants_data)
+                category_variant_options = fetch_category_variant_options(row[0] for row in variant_rows)
+                
+                for option_id, variant_data, stock_count, price_adjustment in variant_rows:
+                    category_variant_option = category_variant_options.get(option_id)
+                    if category_variant_option is None:
+                        continue
+                    
+                    product_variants[option_id] = ProductCategoryVariantOption(
+                        category_variant_option=category_variant_option,
+                        stock_count=stock_count,
+                        price_adjustment=price_adjustment,
+                        is_active=True
+                    )
+                    
+                    # Add to combination_stocks for Flutter compatibility
+                    # Use the option_id as sent as the key and stock_count as value
+                    combination_stocks[str(variant_data.get('option_id'))] = stock_count
+            
             product_data = {
                 'name': name,
                 'description': description,
                 'base_price': base_price,
                 'stock_quantity': stock_quantity,
                 'category_id': category_id,
-                'is_featured': bool(is_featured),
+                'is_featured': is_featured,
                 'seller': request.user,
-                'is_active': True
+                'is_active': True,
+                'combination_stocks': combination_stocks
             }
             
             # Create product
             product = Product.objects.create(**product_data)
             
-            # Handle images
-            images = request.FILES.getlist('images')
-            for i, image_file in enumerate(images):
-                ProductImage.objects.create(
-                    product=product,
-                    image=image_file,
-                    is_primary=(i == 0)  # First image is primary
-                )
-            
-            # Parse variants data from frontend
-            variants_data_str = request.data.get('variants_data', '[]')
-            print(f"DEBUG: Raw variants_data_str: {variants_data_str}")
-            
-            try:
-                variants_data = json.loads(variants_data_str) if variants_data_str else []
-                print(f"DEBUG: Parsed variants_data length: {len(variants_data)}")
-                print(f"DEBUG: First few variants_data items: {variants_data[:3] if variants_data else 'None'}")
-            except json.JSONDecodeError as e:
-                print(f"DEBUG: JSON decode error: {e}")
-                variants_data = []
+            # Handle images: write files to storage concurrently, then insert rows in one query
+            if images:
+                image_names = save_uploaded_images(images)
+                ProductImage.objects.bulk_create([
+                    ProductImage(
+                        product=product,
+                        image=image_name,
+                        is_primary=(i == 0)  # First image is primary
+                    )
+                    for i, image_name in enumerate(image_names)
+                ])
             
             # Create variants using the new ProductCategoryVariantOption model
             variants_created = 0
-            combination_stocks = {}  # For Flutter app compatibility
-            
             if variants_data:
                 # Ensure category has the required variant types for the variants being created
-                category = product.category
-                print(f"DEBUG: Ensuring variant types for category: {category.name}")
-                
-                # Analyze what variant types are needed based on the variants being created
-                variant_types_needed = set()
-                for variant_data in variants_data:
-                    try:
-                        option_id = variant_data.get('option_id')
-                        # Try to get the option to see what variant type it belongs to
-                        try:
-                            category_variant_option = CategoryVariantOption.objects.get(id=option_id)
-                            variant_type = category_variant_option.variant_type
-                            variant_types_needed.add(variant_type)
-                        except CategoryVariantOption.DoesNotExist:
-                            print(f"DEBUG: CategoryVariantOption with id {option_id} not found, skipping")
-                            continue
-                    except Exception as e:
-                        print(f"DEBUG: Error analyzing variant data: {e}")
-                        continue
-                
-                # Ensure all needed variant types are associated with the category
-                for variant_type in variant_types_needed:
-                    if not category.variant_types.filter(id=variant_type.id).exists():
-                        # Create CategoryVariantType if it doesn't exist instead of trying to add
-                        from products.models import CategoryVariantType
-                        category_variant_type, created = CategoryVariantType.objects.get_or_create(
-                            category=category,
-                            name=variant_type.name,
-                            defaults={'is_required': variant_type.is_required}
-                        )
-                        if created:
-                            print(f"DEBUG: Created variant type '{variant_type.name}' for category '{category.name}'")
-                        else:
-                            print(f"DEBUG: Variant type '{variant_type.name}' already exists for category '{category.name}'")
-                
-                print(f"DEBUG: Category '{category.name}' now has {category.variant_types.count()} variant types")
-                # print(f"DEBUG: Processing {len(variants_data)} variant options...")
-                
-                # Group variants by combination for combination_stocks
-                from collections import defaultdict
-                combination_groups = defaultdict(list)
-                
-                for variant_data in variants_data:
-                    # print(f"DEBUG: Processing variant data: {variant_data}")
-                    
-                    try:
-                        option_id = variant_data.get('option_id')
-                        stock_count = int(variant_data.get('stock_count', 0))
-                        price_adjustment = float(variant_data.get('price_adjustment', 0))
-                        
-                        # print(f"DEBUG: Creating variant for option_id: {option_id}, stock: {stock_count}, price_adj: {price_adjustment}")
-                        
-                        # Get the category variant option
-                        category_variant_option = CategoryVariantOption.objects.get(id=option_id)
-                        # print(f"DEBUG: Found category variant option: {category_variant_option}")
-                        
-                        # Create the product variant option
-                        product_variant, created = ProductCategoryVariantOption.objects.get_or_create(
-                            product=product,
-                            category_variant_option=category_variant_option,
-                            defaults={
-                                'stock_count': stock_count,
-                                'price_adjustment': price_adjustment,
-                                'is_active': True
-                            }
-                        )
-                        
-                        if created:
-                            variants_created += 1
-                            # print(f"DEBUG: Created variant {variants_created}")
-                        else:
-                            # print(f"DEBUG: Variant already existed, updated it")
-                            product_variant.stock_count = stock_count
-                            product_variant.price_adjustment = price_adjustment
-                            product_variant.save()
-                        
-                        # Add to combination_stocks for Flutter compatibility
-                        # Use the option_id as the key and stock_count as value
-                        combination_stocks[str(option_id)] = stock_count
-                        
-                    except CategoryVariantOption.DoesNotExist:
-                        # print(f"DEBUG: CategoryVariantOption with id {option_id} not found")
-                        continue
-                    except Exception as e:
-                        # print(f"DEBUG: Error creating variant: {e}")
-                        continue
-                
-                # Update the product's combination_stocks field for Flutter app compatibility
-                product.combination_stocks = combination_stocks
-                product.save(update_fields=['combination_stocks'])
-                print(f"DEBUG: Updated product.combination_stocks: {product.combination_stocks}")
-                print(f"DEBUG: Product has_variants: {product.has_variants}")
-                print(f"DEBUG: Product selected_variants count: {product.selected_variants.count()}")
+                variant_types_needed = {option.variant_type for option in category_variant_options.values()}
+                ensure_category_variant_types(product.category, variant_types_needed)
                 
-                # Log a sample variant for debugging
-                sample_variant = product.selected_variants.first()
-                if sample_variant:
-                    print(f"DEBUG: Sample variant - Type: {sample_variant.variant_type_name}, Value: {sample_variant.variant_option_value}, Stock: {sample_variant.stock_count}")
-                    print(f"DEBUG: Sample variant category_variant_option.variant_type: {sample_variant.category_variant_option.variant_type}")
+                for product_variant in product_variants.values():
+                    product_variant.product = product
+                ProductCategoryVariantOption.objects.bulk_create(product_variants.values())
+                variants_created = len(product_variants)
                 
             
-            # print(f"DEBUG: Total variants created: {variants_created}")
             
             # Log admin activity
-            AdminActivity.objects.create(
-                admin=request.user,
-                action='create',
-                description=f"Created product '{product.name}' with {variants_created} variants",
-                ip_address=request.META.get('REMOTE_ADDR')
+            log_admin_activity(
+                request, 'create', f"Created product '{product.name}' with {variants_created} variants"
             )
             
             return Response({
@@ -1037,14 +1343,14 @@ def create_product_with_variants(request):
             })
             
     except ValueError as e:
-        print(f"ValueError in create_product_with_variants: {str(e)}")
+        logger.warning("ValueError in create_product_with_variants: %s", e)
         return Response({
             'status': 'error',
             'error': 'Invalid data provided',
             'details': str(e)
         }, status=status.HTTP_400_BAD_REQUEST)
     except PermissionError as e:
-        print(f"PermissionError in create_product_with_variants: {str(e)}")
+        logger.warning("PermissionError in create_product_with_variants: %s", e)
         return Response({
             'status': 'error',
             'error': 'Permission denied',
@@ -1052,14 +1358,7 @@ def create_product_with_variants(request):
         }, status=status.HTTP_403_FORBIDDEN)
     except Exception as e:
         # Log the error for debugging
-        import logging
-        import traceback
-        logger = logging.getLogger(__name__)
-        logger.error(f"Error creating product with variants: {str(e)}", exc_info=True)
-        print(f"FULL ERROR in create_product_with_variants:")
-        print(f"Error: {str(e)}")
-        print(f"Type: {type(e)}")
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.error("Error creating product with variants: %s", e, exc_info=True)
         
         return Response({
             'status': 'error',
@@ -1071,55 +1370,77 @@ def create_product_with_variants(request):
 @permission_classes([IsAuthenticated, IsAdminUser])
 def get_categories_for_admin(request):
     """API endpoint to get all active categories for admin use - sorted hierarchically"""
-    from products.models import Category
     
-    # Get categories sorted by hierarchy: parent categories first, then subcategories
-    parent_categories = Category.objects.filter(is_active=True, parent__isnull=True).order_by('name')
-    subcategories = Category.objects.filter(is_active=True, parent__isnull=False).select_related('parent').order_by('parent__name', 'name')
+    # Get categories sorted by hierarchy in one query: parent categories by name first,
+    # then subcategories grouped under their parents
+    categories = Category.objects.filter(is_active=True).annotate(
+        is_subcategory=Case(When(parent__isnull=True, then=0), default=1, output_field=IntegerField())
+    ).order_by('is_subcategory', 'parent__name', 'name').values(
+        'id', 'name', 'description', 'parent_id', 'image', 'is_active', 'parent__name'
+    )
+    image_storage = Category._meta.get_field('image').storage
     
     categories_data = []
-    
-    # Add parent categories first
-    for category in parent_categories:
-        categories_data.append({
-            'id': category.id,
-            'name': category.name,
-            'description': category.description,
-            'parent_id': None,
-            'image': category.image.url if category.image else None,
-            'is_active': category.is_active,
-            'is_parent': True
-        })
-    
-    # Add subcategories grouped under their parents
-    for category in subcategories:
+    for category in categories:
+        if category['parent_id'] is None:
+            categories_data.append({
+                'id': category['id'],
+                'name': category['name'],
+                'description': category['description'],
+                'parent_id': None,
+                'image': image_storage.url(category['image']) if category['image'] else None,
+                'is_active': category['is_active'],
+                'is_parent': True
+            })
+            continue
+        
         categories_data.append({
-            'id': category.id,
-            'name': f"  └─ {category.name}",  # Indent subcategories visually
-            'description': category.description,
-            'parent_id': category.parent_id,
-            'image': category.image.url if category.image else None,
-            'is_active': category.is_active,
+            'id': category['id'],
+            'name': f"  └─ {category['name']}",  # Indent subcategories visually
+            'description': category['description'],
+            'parent_id': category['parent_id'],
+            'image': image_storage.url(category['image']) if category['image'] else None,
+            'is_active': category['is_active'],
             'is_parent': False,
-            'parent_name': category.parent.name
+            'parent_name': category['parent__name']
         })
     
-    return Response(categories_data)
+    return json_response(categories_data)
+
+
+def _category_attributes_etag(request, category_id):
+    """Weak ETag for a category's attributes, changing on any edit, add or removal"""
+    # Attribute, option and category attribute changes are tracked by a version the products
+    # signals reset on save/delete; a fresh version is started whenever none is cached
+    cache.add(ATTRIBUTES_VERSION_CACHE_KEY, time.time_ns(), timeout=None)
+    version = cache.get(ATTRIBUTES_VERSION_CACHE_KEY)
+    # The category row itself decides between the attributes and a 404
+    category_changed = Category.objects.filter(id=category_id).values_list('updated_at', flat=True).first()
+    state = repr((category_id, version, category_changed))
+    return 'W/"%s"' % hashlib.md5(state.encode()).hexdigest()
 
 
+@cache_control(private=True, no_cache=True)
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsAdminUser])
+@condition(etag_func=_category_attributes_etag)
 def get_category_attributes_for_admin(request, category_id):
     """API endpoint to get attributes available for a specific category"""
-    from products.models import Category, CategoryAttribute
     
     try:
         category = Category.objects.get(id=category_id, is_active=True)
         
+        # Load every attribute's active options in one extra query
         category_attributes = CategoryAttribute.objects.filter(
             category=category,
             attribute__is_active=True
-        ).select_related('attribute').order_by('sort_order')
+        ).select_related('attribute').prefetch_related(
+            Prefetch(
+                'attribute__options',
+                queryset=ProductAttributeOption.objects.filter(is_active=True).order_by('sort_order'),
+                to_attr='active_options'
+            )
+        ).order_by('sort_order')
         
         attributes_data = []
         for cat_attr in category_attributes:
@@ -1127,7 +1448,7 @@ def get_category_attributes_for_admin(request, category_id):
             
             # Get active options
             options_data = []
-            for option in attribute.options.filter(is_active=True).order_by('sort_order'):
+            for option in attribute.active_options:
                 options_data.append({
                     'id': option.id,
                     'value': option.value,
@@ -1151,7 +1472,7 @@ def get_category_attributes_for_admin(request, category_id):
                 }
             })
         
-        return Response(attributes_data)
+        return json_response(attributes_data)
         
     except Category.DoesNotExist:
         return Response({
@@ -1163,7 +1484,6 @@ def get_category_attributes_for_admin(request, category_id):
 @permission_classes([IsAuthenticated, IsAdminUser])
 def get_attribute_options_for_admin(request, attribute_type):
     """API endpoint to get options for a specific attribute type"""
-    from products.models import ProductAttribute
     
     try:
         attribute = ProductAttribute.objects.get(
@@ -1171,18 +1491,11 @@ def get_attribute_options_for_admin(request, attribute_type):
             is_active=True
         )
         
-        options_data = []
-        for option in attribute.options.filter(is_active=True).order_by('sort_order'):
-            options_data.append({
-                'id': option.id,
-                'value': option.value,
-                'display_name': option.display_name,
-                'color_code': option.color_code,
-                'is_active': option.is_active,
-                'sort_order': option.sort_order
-            })
+        options_data = list(attribute.options.filter(is_active=True).order_by('sort_order').values(
+            'id', 'value', 'display_name', 'color_code', 'is_active', 'sort_order'
+        ))
         
-        return Response(options_data)
+        return json_response(options_data)
         
     except ProductAttribute.DoesNotExist:
         return Response({
@@ -1190,17 +1503,37 @@ def get_attribute_options_for_admin(request, attribute_type):
         }, status=status.HTTP_404_NOT_FOUND)
 
 
+VARIANT_BATCH_SIZE = 500
+
+
+def bulk_create_product_variants(product, variants):
+    """
+    Insert new ProductVariant rows in bulk, assigning the SKUs ProductVariant.save() would.
+
+    Rows go in under unique placeholder SKUs so their ids can be read back on backends that
+    don't return primary keys from bulk inserts, then get their final SKU in one bulk update.
+    """
+    for variant in variants:
+        variant.sku = f"P{product.id}-{uuid.uuid4().hex}"
+    ProductVariant.objects.bulk_create(variants)
+    
+    if variants and variants[0].pk is None:
+        ids_by_sku = dict(
+            ProductVariant.objects.filter(sku__in=[variant.sku for variant in variants]).values_list('sku', 'id')
+        )
+        for variant in variants:
+            variant.pk = ids_by_sku[variant.sku]
+            variant._state.adding = False
+    
+    for variant in variants:
+        variant.sku = f"P{product.id}V{variant.id}-"
+    ProductVariant.objects.bulk_update(variants, ['sku'])
+    return variants
+
 @api_view(['PUT'])
 @permission_classes([IsAuthenticated, IsAdminUser])
 def update_product_with_variants(request, product_id):
     """API endpoint to update a product with variants"""
-    from products.models import (
-        Product, ProductImage, ProductAttribute, ProductAttributeOption, 
-        ProductVariant, ProductVariantAttribute
-    )
-    from django.db import transaction
-    import json
-    
     try:
         product = Product.objects.get(id=product_id)
     except Product.DoesNotExist:
@@ -1208,6 +1541,16 @@ def update_product_with_variants(request, product_id):
             'error': 'Product not found'
         }, status=status.HTTP_404_NOT_FOUND)
     
+    # Validate uploaded files first, binding the list once for the image handling below
+    images = request.FILES.getlist('images')
+    if images:
+        file_errors = validate_uploaded_files(images)
+        if file_errors:
+            return Response({
+                'status': 'error',
+                'errors': file_errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+    
     try:
         with transaction.atomic():
             # Update basic product data
@@ -1224,39 +1567,52 @@ def update_product_with_variants(request, product_id):
             
             category_id = request.data.get('category')
             if category_id:
-                from products.models import Category
-                product.category = Category.objects.get(id=int(category_id))
+                # Only the FK is needed, so check existence instead of loading the category row
+                category_id = int(category_id)
+                if not Category.objects.filter(id=category_id).exists():
+                    raise ValueError(f"Category {category_id} does not exist")
+                product.category_id = category_id
             
             product.is_featured = request.data.get('is_featured', False)
             product.is_active = request.data.get('is_active', True)
             product.save()
             
             # Handle images if new ones are uploaded
-            images = request.FILES.getlist('images')
             if images:
                 # Delete existing images
                 product.images.all().delete()
                 
-                # Add new images
-                for i, image_file in enumerate(images):
-                    ProductImage.objects.create(
+                # Add new images: write files concurrently, then insert rows in one query
+                image_names = save_uploaded_images(images)
+                ProductImage.objects.bulk_create([
+                    ProductImage(
                         product=product,
-                        image=image_file,
+                        image=image_name,
                         is_primary=(i == 0)  # First image is primary
                     )
+                    for i, image_name in enumerate(image_names)
+                ])
             
             # Handle variants if attributes are selected
-            selected_attributes = {}
-            for key in request.data.keys():
+            option_groups = {}
+            for key in request.data:
                 if key.startswith('selected_') and key.endswith('_options'):
-                    attribute_type = key.replace('selected_', '').replace('_options', '')
+                    attribute_type = key[9:-8]  # strip 'selected_' and '_options'
                     option_ids = request.data.getlist(key)
                     if option_ids:
-                        options = ProductAttributeOption.objects.filter(
-                            id__in=option_ids,
-                            is_active=True
-                        )
-                        selected_attributes[attribute_type] = list(options)
+                        option_groups[attribute_type] = {int(option_id) for option_id in option_ids}
+            
+            # Fetch the options of every attribute type in one query, then split them per type
+            selected_attributes = {attribute_type: [] for attribute_type in option_groups}
+            if option_groups:
+                options = ProductAttributeOption.objects.select_related('attribute').filter(
+                    id__in=set().union(*option_groups.values()),
+                    is_active=True
+                )
+                for option in options:
+                    for attribute_type, option_ids in option_groups.items():
+                        if option.id in option_ids:
+                            selected_attributes[attribute_type].append(option)
             
             # Generate new variants if attributes are selected
             variants_created = 0
@@ -1268,46 +1624,48 @@ def update_product_with_variants(request, product_id):
                 attribute_types = list(selected_attributes.keys())
                 option_lists = [selected_attributes[attr_type] for attr_type in attribute_types]
                 
-                import itertools
-                all_combinations = list(itertools.product(*option_lists))
+                combinations = itertools.product(*option_lists)
                 
                 # Parse variants data from frontend
                 variants_data_str = request.data.get('variants_data', '[]')
                 variants_data = json.loads(variants_data_str) if variants_data_str else []
                 
-                for i, combination in enumerate(all_combinations):
-                    # Get variant data for this combination (if provided)
-                    variant_data = variants_data[i] if i < len(variants_data) else {}
-                    
-                    # Handle boolean conversion for variant
-                    is_active = variant_data.get('is_active', True)
-                    if isinstance(is_active, str):
-                        is_active = is_active.lower() in ('true', '1', 'yes', 'on')
+                # Walk the combinations lazily so large attribute sets never
+                # sit in memory all at once
+                while chunk := list(itertools.islice(combinations, VARIANT_BATCH_SIZE)):
+                    variants = []
+                    for i, combination in enumerate(chunk, start=variants_created):
+                        # Get variant data for this combination (if provided)
+                        variant_data = variants_data[i] if i < len(variants_data) else {}
+                        
+                        # Handle boolean conversion for variant
+                        is_active = parse_bool(variant_data.get('is_active', True))
+                        
+                        variants.append(ProductVariant(
+                            product=product,
+                            stock_count=int(variant_data.get('stock_count', 0)),
+                            price_adjustment=float(variant_data.get('price_adjustment', 0)),
+                            is_active=is_active
+                        ))
                     
-                    # Create variant
-                    variant = ProductVariant.objects.create(
-                        product=product,
-                        stock_count=int(variant_data.get('stock_count', 0)),
-                        price_adjustment=float(variant_data.get('price_adjustment', 0)),
-                        is_active=bool(is_active)
-                    )
+                    # Insert this batch of variants at once
+                    bulk_create_product_variants(product, variants)
                     
-                    # Create variant attributes
-                    for option in combination:
-                        ProductVariantAttribute.objects.create(
+                    # Create variant attributes for the batch
+                    ProductVariantAttribute.objects.bulk_create([
+                        ProductVariantAttribute(
                             variant=variant,
                             attribute=option.attribute,
                             option=option
                         )
-                    
-                    variants_created += 1
+                        for variant, combination in zip(variants, chunk)
+                        for option in combination
+                    ])
+                    variants_created += len(variants)
             
             # Log admin activity
-            AdminActivity.objects.create(
-                admin=request.user,
-                action='update',
-                description=f"Updated product '{product.name}' with {variants_created} variants",
-                ip_address=request.META.get('REMOTE_ADDR')
+            log_admin_activity(
+                request, 'update', f"Updated product '{product.name}' with {variants_created} variants"
             )
             
             return Response({
@@ -1331,8 +1689,6 @@ def update_product_with_variants(request, product_id):
         }, status=status.HTTP_403_FORBIDDEN)
     except Exception as e:
         # Log the error for debugging
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Error updating product with variants: {str(e)}", exc_info=True)
         
         return Response({
@@ -1353,7 +1709,7 @@ def list_advertisements(request):
     is_active = request.query_params.get('is_active')
     
     # Build queryset
-    queryset = Advertisement.objects.select_related('category').all()
+    queryset = Advertisement.objects.all()
     
     # Apply filters
     if main_only == 'true':
@@ -1375,31 +1731,63 @@ def list_advertisements(request):
     # Order by category, then order, then creation date
     queryset = queryset.order_by('category__name', 'order', '-created_at')
     
-    # Prepare response data
+    # Prepare response data from plain rows, skipping model instantiation
+    rows = queryset.values(
+        'id', 'title', 'description', 'image', 'image_url', 'link_url', 'category_id', 'category__name',
+        'show_on_main', 'is_active', 'order', 'created_at', 'updated_at'
+    )
+    image_storage = Advertisement._meta.get_field('image').storage
     ads_data = []
-    for ad in queryset:
+    for ad in rows.iterator(chunk_size=500):
+        # Same rules as Advertisement.display_location
+        locations = []
+        if ad['show_on_main']:
+            locations.append("Main Page")
+        if ad['category_id']:
+            locations.append(f"Category: {ad['category__name']}")
+        
         ads_data.append({
-            'id': ad.id,
-            'title': ad.title,
-            'description': ad.description,
-            'imageUrl': ad.image_display_url,
-            'linkUrl': ad.link_url,
-            'category_id': ad.category_id,
-            'category_name': ad.category.name if ad.category else None,
-            'show_on_main': ad.show_on_main,
-            'display_location': ad.display_location,
-            'isActive': ad.is_active,
-            'order': ad.order,
-            'created_at': ad.created_at.isoformat(),
-            'updated_at': ad.updated_at.isoformat()
+            'id': ad['id'],
+            'title': ad['title'],
+            'description': ad['description'],
+            # Same precedence as Advertisement.image_display_url: external URL first
+            'imageUrl': ad['image_url'] or (image_storage.url(ad['image']) if ad['image'] else None),
+            'linkUrl': ad['link_url'],
+            'category_id': ad['category_id'],
+            'category_name': ad['category__name'],
+            'show_on_main': ad['show_on_main'],
+            'display_location': " & ".join(locations) if locations else "Inactive",
+            'isActive': ad['is_active'],
+            'order': ad['order'],
+            'created_at': ad['created_at'],
+            'updated_at': ad['updated_at']
         })
     
-    return Response({
+    return json_response({
         'advertisements': ads_data,
         'count': len(ads_data)
     })
 
 
+def serialize_advertisement(ad):
+    """Advertisement fields in the admin panel's format; load the category with the ad"""
+    return {
+        'id': ad.id,
+        'title': ad.title,
+        'description': ad.description,
+        'imageUrl': ad.image_display_url,
+        'linkUrl': ad.link_url,
+        'category_id': ad.category_id,
+        'category_name': ad.category.name if ad.category_id else None,
+        'show_on_main': ad.show_on_main,
+        'display_location': ad.display_location,
+        'isActive': ad.is_active,
+        'order': ad.order,
+        'created_at': ad.created_at,
+        'updated_at': ad.updated_at
+    }
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated, IsAdminUser])
 def create_advertisement(request):
@@ -1451,31 +1839,16 @@ def create_advertisement(request):
         )
         
         # Log admin activity
-        AdminActivity.objects.create(
-            admin=request.user,
-            action='create',
-            description=f'Created advertisement "{ad.title}" for {ad.display_location}',
-            ip_address=request.META.get('REMOTE_ADDR')
+        log_admin_activity(
+            request,
+            'create',
+            f'Created advertisement "{ad.title}" for {ad.display_location}'
         )
         
         return Response({
             'status': 'success',
             'message': 'Advertisement created successfully',
-            'advertisement': {
-                'id': ad.id,
-                'title': ad.title,
-                'description': ad.description,
-                'imageUrl': ad.image_display_url,
-                'linkUrl': ad.link_url,
-                'category_id': ad.category_id,
-                'category_name': ad.category.name if ad.category else None,
-                'show_on_main': ad.show_on_main,
-                'display_location': ad.display_location,
-                'isActive': ad.is_active,
-                'order': ad.order,
-                'created_at': ad.created_at.isoformat(),
-                'updated_at': ad.updated_at.isoformat()
-            }
+            'advertisement': serialize_advertisement(ad)
         })
         
     except Exception as e:
@@ -1489,49 +1862,47 @@ def create_advertisement(request):
 def manage_advertisement_detail(request, ad_id):
     """API endpoint to get, update, or delete a specific advertisement"""
     
-    try:
-        ad = Advertisement.objects.select_related('category').get(id=ad_id)
-    except Advertisement.DoesNotExist:
+    ads = Advertisement.objects.select_related('category')
+    if request.method == 'DELETE':
+        # Deleting only needs the fields used to describe the ad in the activity log
+        ads = ads.only('id', 'title', 'show_on_main', 'category__name')
+    
+    ad = ads.filter(id=ad_id).first()
+    if ad is None:
         return Response({
             'error': 'Advertisement not found'
         }, status=status.HTTP_404_NOT_FOUND)
     
     if request.method == 'GET':
         # Return advertisement details
-        return Response({
-            'id': ad.id,
-            'title': ad.title,
-            'description': ad.description,
-            'imageUrl': ad.image_display_url,
-            'linkUrl': ad.link_url,
-            'category_id': ad.category_id,
-            'category_name': ad.category.name if ad.category else None,
-            'show_on_main': ad.show_on_main,
-            'display_location': ad.display_location,
-            'isActive': ad.is_active,
-            'order': ad.order,
-            'created_at': ad.created_at.isoformat(),
-            'updated_at': ad.updated_at.isoformat()
-        })
+        return Response(serialize_advertisement(ad))
     
     elif request.method == 'PUT':
         # Update advertisement
         try:
-            # Extract data from request
+            # Extract data from request, tracking which columns change
+            updated_fields = ['updated_at']
             if 'title' in request.data:
                 ad.title = request.data['title'].strip()
+                updated_fields.append('title')
             if 'description' in request.data:
                 ad.description = request.data['description'].strip()
+                updated_fields.append('description')
             if 'image_url' in request.data:
                 ad.image_url = request.data['image_url'].strip()
+                updated_fields.append('image_url')
             if 'link_url' in request.data:
                 ad.link_url = request.data['link_url'].strip()
+                updated_fields.append('link_url')
             if 'order' in request.data:
                 ad.order = int(request.data['order'])
+                updated_fields.append('order')
             if 'is_active' in request.data:
                 ad.is_active = bool(request.data['is_active'])
+                updated_fields.append('is_active')
             if 'show_on_main' in request.data:
                 ad.show_on_main = bool(request.data['show_on_main'])
+                updated_fields.append('show_on_main')
             
             # Handle category
             if 'category' in request.data:
@@ -1546,6 +1917,7 @@ def manage_advertisement_detail(request, ad_id):
                         }, status=status.HTTP_400_BAD_REQUEST)
                 else:
                     ad.category = None
+                updated_fields.append('category')
             
             # Validation
             if not ad.title:
@@ -1558,34 +1930,19 @@ def manage_advertisement_detail(request, ad_id):
                     'error': 'Image URL is required'
                 }, status=status.HTTP_400_BAD_REQUEST)
             
-            ad.save()
+            ad.save(update_fields=updated_fields)
             
             # Log admin activity
-            AdminActivity.objects.create(
-                admin=request.user,
-                action='update',
-                description=f'Updated advertisement "{ad.title}" for {ad.display_location}',
-                ip_address=request.META.get('REMOTE_ADDR')
+            log_admin_activity(
+                request,
+                'update',
+                f'Updated advertisement "{ad.title}" for {ad.display_location}'
             )
             
             return Response({
                 'status': 'success',
                 'message': 'Advertisement updated successfully',
-                'advertisement': {
-                    'id': ad.id,
-                    'title': ad.title,
-                    'description': ad.description,
-                    'imageUrl': ad.image_display_url,
-                    'linkUrl': ad.link_url,
-                    'category_id': ad.category_id,
-                    'category_name': ad.category.name if ad.category else None,
-                    'show_on_main': ad.show_on_main,
-                    'display_location': ad.display_location,
-                    'isActive': ad.is_active,
-                    'order': ad.order,
-                    'created_at': ad.created_at.isoformat(),
-                    'updated_at': ad.updated_at.isoformat()
-                }
+                'advertisement': serialize_advertisement(ad)
             })
             
         except Exception as e:
@@ -1601,11 +1958,10 @@ def manage_advertisement_detail(request, ad_id):
             ad.delete()
             
             # Log admin activity
-            AdminActivity.objects.create(
-                admin=request.user,
-                action='delete',
-                description=f'Deleted advertisement "{ad_title}" from {ad_location}',
-                ip_address=request.META.get('REMOTE_ADDR')
+            log_admin_activity(
+                request,
+                'delete',
+                f'Deleted advertisement "{ad_title}" from {ad_location}'
             )
             
             return Response({
@@ -1625,29 +1981,30 @@ def manage_advertisement_detail(request, ad_id):
 def create_seller_application(request):
     """API endpoint for users to submit seller applications"""
     
-    # Check if user already has a pending/approved application
-    existing_application = SellerApplication.objects.filter(
+    # Fetch any applications that block a new one in a single query
+    blocking_applications = list(SellerApplication.objects.filter(
         user=request.user,
-        status__in=['pending', 'approved']
-    ).first()
+        status__in=['pending', 'approved', 'rejected_permanently']
+    ).values('status', 'admin_notes'))
+    
+    # Check if user already has a pending/approved application
+    existing_application = next(
+        (app for app in blocking_applications if app['status'] != 'rejected_permanently'),
+        None
+    )
     
     if existing_application:
         return Response({
             'error': 'You already have a pending or approved seller application',
-            'status': existing_application.status
+            'status': existing_application['status']
         }, status=status.HTTP_400_BAD_REQUEST)
     
     # Check if user has been permanently rejected
-    permanently_rejected = SellerApplication.objects.filter(
-        user=request.user,
-        status='rejected_permanently'
-    ).first()
-    
-    if permanently_rejected:
+    if blocking_applications:
         return Response({
             'error': 'Your seller application has been permanently rejected. You cannot apply again.',
             'status': 'rejected_permanently',
-            'admin_notes': permanently_rejected.admin_notes
+            'admin_notes': blocking_applications[0]['admin_notes']
         }, status=status.HTTP_403_FORBIDDEN)
     
     serializer = SellerApplicationCreateSerializer(
@@ -1681,17 +2038,19 @@ def create_seller_application(request):
 @permission_classes([])  # Allow any user to get categories
 def get_categories_for_seller(request):
     """API endpoint to get categories for seller registration"""
-    from products.models import Category
     
-    categories = Category.objects.filter(is_active=True, parent__isnull=True).order_by('name')
+    categories = Category.objects.filter(
+        is_active=True, parent__isnull=True
+    ).order_by('name').values('id', 'name', 'description')
     
-    categories_data = []
-    for category in categories:
-        categories_data.append({
-            'id': category.id,
-            'name': category.name,
-            'description': category.description or '',
-        })
+    categories_data = [
+        {
+            'id': category['id'],
+            'name': category['name'],
+            'description': category['description'] or '',
+        }
+        for category in categories
+    ]
     
     return Response(categories_data)
 
@@ -1700,72 +2059,71 @@ def get_categories_for_seller(request):
 @permission_classes([])  # Allow any user to get subcategories
 def get_subcategories_for_seller(request, category_id):
     """API endpoint to get subcategories for a main category"""
-    from products.models import Category
     
-    try:
-        # Check if main category exists
-        main_category = Category.objects.get(id=category_id, is_active=True)
-        
-        # Get subcategories
-        subcategories = Category.objects.filter(
-            parent=main_category, 
-            is_active=True
-        ).order_by('name')
-        
-        subcategories_data = []
-        for subcategory in subcategories:
-            subcategories_data.append({
-                'id': subcategory.id,
-                'name': subcategory.name,
-                'description': subcategory.description or '',
-                'parent_id': subcategory.parent_id,
-            })
-        
-        return Response(subcategories_data)
-        
-    except Category.DoesNotExist:
+    # Check if main category exists
+    if not Category.objects.filter(id=category_id, is_active=True).exists():
         return Response({
             'error': 'Category not found'
         }, status=status.HTTP_404_NOT_FOUND)
+    
+    # Get subcategories
+    subcategories = Category.objects.filter(
+        parent_id=category_id, 
+        is_active=True
+    ).order_by('name').values('id', 'name', 'description', 'parent_id')
+    
+    subcategories_data = [
+        {
+            'id': subcategory['id'],
+            'name': subcategory['name'],
+            'description': subcategory['description'] or '',
+            'parent_id': subcategory['parent_id'],
+        }
+        for subcategory in subcategories
+    ]
+    
+    return Response(subcategories_data)
+
+
+# Egyptian governorates list; the payload never changes, so it is encoded once at import
+EGYPTIAN_GOVERNORATES = (
+    {'id': 1, 'name': 'القاهرة', 'name_en': 'Cairo'},
+    {'id': 2, 'name': 'الجيزة', 'name_en': 'Giza'},
+    {'id': 3, 'name': 'الأقصر', 'name_en': 'Luxor'},
+    {'id': 4, 'name': 'أسوان', 'name_en': 'Aswan'},
+    {'id': 5, 'name': 'أسيوط', 'name_en': 'Asyut'},
+    {'id': 6, 'name': 'البحيرة', 'name_en': 'Beheira'},
+    {'id': 7, 'name': 'بني سويف', 'name_en': 'Beni Suef'},
+    {'id': 8, 'name': 'البحر الأحمر', 'name_en': 'Red Sea'},
+    {'id': 9, 'name': 'الدقهلية', 'name_en': 'Dakahlia'},
+    {'id': 10, 'name': 'دمياط', 'name_en': 'Damietta'},
+    {'id': 11, 'name': 'الفيوم', 'name_en': 'Fayyum'},
+    {'id': 12, 'name': 'الغربية', 'name_en': 'Gharbia'},
+    {'id': 13, 'name': 'الإسماعيلية', 'name_en': 'Ismailia'},
+    {'id': 14, 'name': 'كفر الشيخ', 'name_en': 'Kafr el-Sheikh'},
+    {'id': 15, 'name': 'مطروح', 'name_en': 'Matrouh'},
+    {'id': 16, 'name': 'المنيا', 'name_en': 'Minya'},
+    {'id': 17, 'name': 'المنوفية', 'name_en': 'Monufia'},
+    {'id': 18, 'name': 'الوادي الجديد', 'name_en': 'New Valley'},
+    {'id': 19, 'name': 'شمال سيناء', 'name_en': 'North Sinai'},
+    {'id': 20, 'name': 'بورسعيد', 'name_en': 'Port Said'},
+    {'id': 21, 'name': 'القليوبية', 'name_en': 'Qalyubia'},
+    {'id': 22, 'name': 'قنا', 'name_en': 'Qena'},
+    {'id': 23, 'name': 'الشرقية', 'name_en': 'Sharqia'},
+    {'id': 24, 'name': 'سوهاج', 'name_en': 'Sohag'},
+    {'id': 25, 'name': 'جنوب سيناء', 'name_en': 'South Sinai'},
+    {'id': 26, 'name': 'السويس', 'name_en': 'Suez'},
+    {'id': 27, 'name': 'الإسكندرية', 'name_en': 'Alexandria'},
+)
+EGYPTIAN_GOVERNORATES_JSON = dump_json(EGYPTIAN_GOVERNORATES)
 
 
+@cache_control(public=True, max_age=86400)
 @api_view(['GET'])
 @permission_classes([])  # Allow any user to get governorates
 def get_egyptian_governorates(request):
     """API endpoint to get Egyptian governorates for shipping costs"""
-    
-    # Egyptian governorates list
-    governorates = [
-        {'id': 1, 'name': 'القاهرة', 'name_en': 'Cairo'},
-        {'id': 2, 'name': 'الجيزة', 'name_en': 'Giza'},
-        {'id': 3, 'name': 'الأقصر', 'name_en': 'Luxor'},
-        {'id': 4, 'name': 'أسوان', 'name_en': 'Aswan'},
-        {'id': 5, 'name': 'أسيوط', 'name_en': 'Asyut'},
-        {'id': 6, 'name': 'البحيرة', 'name_en': 'Beheira'},
-        {'id': 7, 'name': 'بني سويف', 'name_en': 'Beni Suef'},
-        {'id': 8, 'name': 'البحر الأحمر', 'name_en': 'Red Sea'},
-        {'id': 9, 'name': 'الدقهلية', 'name_en': 'Dakahlia'},
-        {'id': 10, 'name': 'دمياط', 'name_en': 'Damietta'},
-        {'id': 11, 'name': 'الفيوم', 'name_en': 'Fayyum'},
-        {'id': 12, 'name': 'الغربية', 'name_en': 'Gharbia'},
-        {'id': 13, 'name': 'الإسماعيلية', 'name_en': 'Ismailia'},
-        {'id': 14, 'name': 'كفر الشيخ', 'name_en': 'Kafr el-Sheikh'},
-        {'id': 15, 'name': 'مطروح', 'name_en': 'Matrouh'},
-        {'id': 16, 'name': 'المنيا', 'name_en': 'Minya'},
-        {'id': 17, 'name': 'المنوفية', 'name_en': 'Monufia'},
-        {'id': 18, 'name': 'الوادي الجديد', 'name_en': 'New Valley'},
-        {'id': 19, 'name': 'شمال سيناء', 'name_en': 'North Sinai'},
-        {'id': 20, 'name': 'بورسعيد', 'name_en': 'Port Said'},
-        {'id': 21, 'name': 'القليوبية', 'name_en': 'Qalyubia'},
-        {'id': 22, 'name': 'قنا', 'name_en': 'Qena'},
-        {'id': 23, 'name': 'الشرقية', 'name_en': 'Sharqia'},
-        {'id': 24, 'name': 'سوهاج', 'name_en': 'Sohag'},
-        {'id': 25, 'name': 'جنوب سيناء', 'name_en': 'South Sinai'},
-        {'id': 26, 'name': 'السويس', 'name_en': 'Suez'},
-        {'id': 27, 'name': 'الإسكندرية', 'name_en': 'Alexandria'},
-    ]
-    
-    return Response(governorates)
+    return HttpResponse(EGYPTIAN_GOVERNORATES_JSON, content_type='application/json; charset=utf-8')
 
 
 @api_view(['GET'])
@@ -1775,21 +2133,27 @@ def get_user_application_status(request):
     
     try:
         # Get the most recent application for this user
-        application = SellerApplication.objects.filter(user=request.user).order_by('-created_at').first()
+        application = SellerApplication.objects.filter(user=request.user).only(
+            'status', 'created_at', 'reviewed_at', 'admin_notes', 'rejection_reason',
+            'business_name', 'seller_type'
+        ).order_by('-created_at').first()
         
         if application:
+            # Each timestamp is sent under two field names; format it once
+            created_at = application.created_at.isoformat()
+            reviewed_at = application.reviewed_at.isoformat() if application.reviewed_at else None
             return Response({
                 'has_application': True,
                 'status': application.status,
                 'status_display': application.get_status_display(),
                 # Provide backward compatibility with Flutter app field names
-                'submitted_at': application.created_at.isoformat(),
-                'processed_at': application.reviewed_at.isoformat() if application.reviewed_at else None,
+                'submitted_at': created_at,
+                'processed_at': reviewed_at,
                 'admin_notes': application.admin_notes,
                 'rejection_reason': application.rejection_reason,
                 # Also provide new field names for future use
-                'created_at': application.created_at.isoformat(),
-                'reviewed_at': application.reviewed_at.isoformat() if application.reviewed_at else None,
+                'created_at': created_at,
+                'reviewed_at': reviewed_at,
                 'business_name': application.business_name,
                 'seller_type': application.seller_type,
                 'seller_type_display': application.get_seller_type_display()
@@ -1860,7 +2224,7 @@ def seller_dashboard_stats(request):
     today = timezone.now().date()
     
     for i in range(6):
-        month_end = today.replace(day=1) - timezone.timedelta(days=1)
+        month_end = today.replace(day=1) - timedelta(days=1)
         month_start = month_end.replace(day=1)
         
         month_revenue = seller_orders.filter(
@@ -1875,7 +2239,7 @@ def seller_dashboard_stats(request):
             'revenue': float(month_revenue)
         })
         
-        today = month_start - timezone.timedelta(days=1)
+        today = month_start - timedelta(days=1)
     
     monthly_revenue.reverse()
     
@@ -1983,7 +2347,6 @@ def seller_products(request):
             )
         
         # Paginate results
-        from rest_framework.pagination import PageNumberPagination
         paginator = PageNumberPagination()
         paginator.page_size = 20
         page = paginator.paginate_queryset(products, request)
@@ -2042,12 +2405,17 @@ def seller_products(request):
                 
                 # Handle images if provided
                 images = request.FILES.getlist('images')
-                for i, image in enumerate(images):
-                    ProductImage.objects.create(
-                        product=product,
-                        image=image,
-                        is_primary=(i == 0)  # First image is primary
-                    )
+                if images:
+                    # Write files concurrently, then insert rows in one query
+                    image_names = save_uploaded_images(images)
+                    ProductImage.objects.bulk_create([
+                        ProductImage(
+                            product=product,
+                            image=image_name,
+                            is_primary=(i == 0)  # First image is primary
+                        )
+                        for i, image_name in enumerate(image_names)
+                    ])
                 
                 return Response({
                     'status': 'success',
@@ -2109,7 +2477,7 @@ def seller_product_detail(request, product_id):
             if 'category_id' in data:
                 product.category_id = data['category_id']
             
-            product.save()
+            product.save(update_fields=['name', 'description', 'base_price', 'stock_quantity', 'is_active', 'category', 'updated_at'])
             
             return Response({
                 'status': 'success',
@@ -2153,13 +2521,17 @@ def seller_orders(request):
     if status_filter:
         order_items = order_items.filter(order__status=status_filter)
     
-    if date_from:
-        date_from = timezone.datetime.strptime(date_from, '%Y-%m-%d').date()
-        order_items = order_items.filter(order__created_at__date__gte=date_from)
-    
-    if date_to:
-        date_to = timezone.datetime.strptime(date_to, '%Y-%m-%d').date()
-        order_items = order_items.filter(order__created_at__date__lte=date_to)
+    try:
+        if date_from:
+            order_items = order_items.filter(order__created_at__date__gte=date.fromisoformat(date_from))
+        
+        if date_to:
+            order_items = order_items.filter(order__created_at__date__lte=date.fromisoformat(date_to))
+    except ValueError:
+        return Response(
+            {'error': 'Invalid date parameters'}, 
+            status=status.HTTP_400_BAD_REQUEST
+        )
     
     if search:
         order_items = order_items.filter(
@@ -2169,7 +2541,6 @@ def seller_orders(request):
         )
     
     # Paginate results
-    from rest_framework.pagination import PageNumberPagination
     paginator = PageNumberPagination()
     paginator.page_size = 20
     page = paginator.paginate_queryset(order_items.order_by('-order__created_at'), request)
@@ -2221,7 +2592,7 @@ def update_order_status(request, order_id):
         
         # Update order status
         order.status = new_status
-        order.save()
+        order.save(update_fields=['status', 'updated_at'])
         
         return Response({
             'status': 'success',
@@ -2318,14 +2689,6 @@ def create_product_wizard(request):
             stock_quantity = request.data.get('stock_quantity')
             category_id = request.data.get('category_id')
             
-            # Helper function to parse boolean from string
-            def parse_bool(value):
-                if isinstance(value, bool):
-                    return value
-                if isinstance(value, str):
-                    return value.lower() in ('true', '1', 'yes', 'on')
-                return bool(value)
-            
             # Parse boolean fields
             featured_request_pending = parse_bool(request.data.get('featured_request_pending', False))
             offers_request_pending = parse_bool(request.data.get('offers_request_pending', False))
@@ -2342,7 +2705,8 @@ def create_product_wizard(request):
                 return Response({'error': 'Product description is required'}, 
                                status=status.HTTP_400_BAD_REQUEST)
             
-            if not base_price or float(base_price) <= 0:
+            base_price = float(base_price) if base_price else 0
+            if base_price <= 0:
                 return Response({'error': 'Valid base price is required'}, 
                                status=status.HTTP_400_BAD_REQUEST)
             
@@ -2350,9 +2714,8 @@ def create_product_wizard(request):
                 stock_quantity = int(stock_quantity) if stock_quantity is not None else 0
                 if stock_quantity < 0:
                     raise ValueError("Stock cannot be negative")
-                print(f"VALIDATION PASSED: stock_quantity = {stock_quantity}")
             except (TypeError, ValueError) as e:
-                print(f"VALIDATION FAILED: stock_quantity error - {e}")
+                logger.debug("Rejected stock_quantity: %s", e)
                 return Response({'error': 'Valid stock quantity is required'}, 
                                status=status.HTTP_400_BAD_REQUEST)
             
@@ -2370,7 +2733,6 @@ def create_product_wizard(request):
             # Handle category variants to determine stock management strategy
             selected_variants = request.data.get('selected_variants', [])
             if isinstance(selected_variants, str):
-                import json
                 selected_variants = json.loads(selected_variants)
             
             # Debug logging
@@ -2395,7 +2757,7 @@ def create_product_wizard(request):
                     product = Product.objects.create(
                         name=name,
                         description=description,
-                        base_price=float(base_price),
+                        base_price=base_price,
                         stock_quantity=0,  # Managed at variant level
                         category=category,
                         seller=request.user,
@@ -2410,8 +2772,8 @@ def create_product_wizard(request):
                     product = Product.objects.create(
                         name=name,
                         description=description,
-                        base_price=float(base_price),
-                        stock_quantity=int(stock_quantity),
+                        base_price=base_price,
+                        stock_quantity=stock_quantity,
                         category=category,
                         seller=request.user,
                         featured_request_pending=featured_request_pending,
@@ -2434,7 +2796,6 @@ def create_product_wizard(request):
             # Handle tags
             tags_data = request.data.get('tags', [])
             if isinstance(tags_data, str):
-                import json
                 tags_data = json.loads(tags_data)
             
             for tag_name in tags_data:
@@ -2452,104 +2813,62 @@ def create_product_wizard(request):
             # Handle category variants if they exist
             if selected_variants:
                 # print(f"DEBUG: Processing {len(selected_variants)} category variants...")
-                from products.models import CategoryVariantOption, ProductCategoryVariantOption
                 
                 # Ensure category has the required variant types for the variants being created
                 category = product.category
-                print(f"DEBUG: Ensuring variant types for seller category: {category.name}")
+                logger.debug("Ensuring variant types for seller category: %s", category.name)
                 
-                # Analyze what variant types are needed based on the variants being created
-                variant_types_needed = set()
-                for variant_data in selected_variants:
-                    try:
-                        option_id = variant_data.get('option_id')
-                        # Try to get the option to see what variant type it belongs to
-                        try:
-                            category_variant_option = CategoryVariantOption.objects.get(id=option_id)
-                            variant_type = category_variant_option.variant_type
-                            variant_types_needed.add(variant_type)
-                        except CategoryVariantOption.DoesNotExist:
-                            print(f"DEBUG: CategoryVariantOption with id {option_id} not found, skipping")
-                            continue
-                    except Exception as e:
-                        print(f"DEBUG: Error analyzing seller variant data: {e}")
-                        continue
+                # Parse every entry once, then load every referenced option in one query;
+                # their variant types are the ones needed
+                variant_rows = parse_variant_entries(selected_variants)
+                category_variant_options = fetch_category_variant_options(row[0] for row in variant_rows)
+                variant_types_needed = {option.variant_type for option in category_variant_options.values()}
                 
                 # Ensure all needed variant types are associated with the category
-                for variant_type in variant_types_needed:
-                    if not category.variant_types.filter(id=variant_type.id).exists():
-                        # Create CategoryVariantType if it doesn't exist instead of trying to add
-                        from products.models import CategoryVariantType
-                        category_variant_type, created = CategoryVariantType.objects.get_or_create(
-                            category=category,
-                            name=variant_type.name,
-                            defaults={'is_required': variant_type.is_required}
+                ensure_category_variant_types(category, variant_types_needed)
+                
+                # The product is new, so build one variant row per option and insert them
+                # together; a repeated option keeps its first entry
+                product_variants = {}
+                for option_id, variant_data, stock_count, price_adjustment in variant_rows:
+                    category_variant_option = category_variant_options.get(option_id)
+                    if category_variant_option is not None and option_id not in product_variants:
+                        product_variants[option_id] = ProductCategoryVariantOption(
+                            product=product,
+                            category_variant_option=category_variant_option,
+                            stock_count=stock_count,
+                            price_adjustment=price_adjustment,
+                            is_active=parse_bool(variant_data.get('is_active', True))
                         )
-                        if created:
-                            print(f"DEBUG: Created variant type '{variant_type.name}' for seller category '{category.name}'")
-                        else:
-                            print(f"DEBUG: Variant type '{variant_type.name}' already exists for seller category '{category.name}'")
                 
-                print(f"DEBUG: Seller category '{category.name}' now has {category.variant_types.count()} variant types")
-                
-                variants_created = 0
-                for variant_data in selected_variants:
-                    try:
-                        option_id = variant_data.get('option_id')
-                        stock_count = int(variant_data.get('stock_count', 0))
-                        price_adjustment = float(variant_data.get('price_adjustment', 0))
-                        is_active = variant_data.get('is_active', True)
-                        
-                        if isinstance(is_active, str):
-                            is_active = is_active.lower() in ('true', '1', 'yes', 'on')
-                        
-                        if option_id:
-                            category_variant_option = CategoryVariantOption.objects.get(id=option_id)
-                            product_variant, created = ProductCategoryVariantOption.objects.get_or_create(
-                                product=product,
-                                category_variant_option=category_variant_option,
-                                defaults={
-                                    'stock_count': stock_count,
-                                    'price_adjustment': price_adjustment,
-                                    'is_active': bool(is_active)
-                                }
-                            )
-                            
-                            if created:
-                                variants_created += 1
-                            else:
-                                 print(f"DEBUG: Variant already exists: {product_variant}")
-                                
-                    except CategoryVariantOption.DoesNotExist:
-                        # print(f"DEBUG: CategoryVariantOption with id {option_id} not found")
-                        continue
-                    except Exception as e:
-                        # print(f"DEBUG: Error creating variant: {e}")
-                        continue
+                ProductCategoryVariantOption.objects.bulk_create(product_variants.values())
+                variants_created = len(product_variants)
                 
                 # print(f"DEBUG: Created {variants_created} category variants for product {product.name}")
                 
                 # Update product total stock based on selected variants
                 total_stock = sum(v.stock_count for v in product.selected_variants.filter(is_active=True))
                 product.stock_quantity = total_stock
-                product.save()
+                product.save(update_fields=['stock_quantity', 'updated_at'])
             
             # Handle images
             images = request.FILES.getlist('images')
             if images:
-                # Process and save images as ProductImage objects
-                for i, image_file in enumerate(images):
-                    ProductImage.objects.create(
+                # Write files concurrently, then insert the ProductImage rows in one query
+                image_names = save_uploaded_images(images)
+                ProductImage.objects.bulk_create([
+                    ProductImage(
                         product=product,
-                        image=image_file,
+                        image=image_name,
                         is_primary=(i == 0)  # First image is primary
                     )
+                    for i, image_name in enumerate(image_names)
+                ])
             
             # Handle discount request
             discount_request_data = request.data.get('discount_request')
             if discount_request_data:
                 if isinstance(discount_request_data, str):
-                    import json
                     discount_request_data = json.loads(discount_request_data)
                 
                 DiscountRequest.objects.create(
@@ -2564,17 +2883,16 @@ def create_product_wizard(request):
             
             # Log admin activity for review (skip if admin field is required)
             try:
-                AdminActivity.objects.create(
-                    admin=request.user,  # Use the submitting user instead of None
-                    action='create',  # Use valid action choice
-                    description=f"New product '{product.name}' submitted by {request.user.username} for review",
-                    ip_address=request.META.get('REMOTE_ADDR')
+                log_admin_activity(
+                    request,
+                    'create',
+                    f"New product '{product.name}' submitted by {request.user.username} for review"
                 )
             except Exception as activity_error:
                 # Don't fail the product creation if activity logging fails
-                 print(f"DEBUG: Failed to log admin activity: {str(activity_error)}")
+                logger.warning("Failed to log admin activity: %s", activity_error)
             
-            print(f"DEBUG: Product created successfully - ID: {product.id}")
+            logger.debug("Product created successfully - ID: %s", product.id)
             
             return Response({
                 'success': True,
@@ -2589,7 +2907,6 @@ def create_product_wizard(request):
             }, status=status.HTTP_201_CREATED)
             
     except Exception as e:
-        import traceback
         error_traceback = traceback.format_exc()
         # print(f"DEBUG: Exception occurred during product creation:")
         # print(f"DEBUG: Error: {str(e)}")
@@ -2629,19 +2946,18 @@ def toggle_seller_product_status(request, product_id):
         
         # Toggle the status
         product.is_active = not product.is_active
-        product.save()
+        product.save(update_fields=['is_active', 'updated_at'])
         
         # Log the activity
         try:
-            AdminActivity.objects.create(
-                admin=request.user,
-                action='toggle_status',
-                description=f'Seller {"activated" if product.is_active else "deactivated"} product "{product.name}"',
-                ip_address=get_client_ip(request)
+            log_admin_activity(
+                request,
+                'toggle_status',
+                f'Seller {"activated" if product.is_active else "deactivated"} product "{product.name}"'
             )
         except Exception as e:
             # Don't fail the toggle if logging fails
-            print(f"Failed to log activity: {e}")
+            logger.warning("Failed to log activity: %s", e)
         
         return Response({
             'status': 'success',
@@ -2688,13 +3004,15 @@ def duplicate_seller_product(request, product_id):
             featured_request_pending=False
         )
         
-        # Copy product images if any
-        for image in original_product.images.all():
-            ProductImage.objects.create(
+        # Copy product images if any; the copies point at the same stored files
+        ProductImage.objects.bulk_create([
+            ProductImage(
                 product=duplicate_product,
-                image=image.image,
-                is_primary=image.is_primary
+                image=image_name,
+                is_primary=is_primary
             )
+            for image_name, is_primary in original_product.images.values_list('image', 'is_primary')
+        ])
         
         return Response({
             'status': 'success',
@@ -2738,7 +3056,7 @@ def update_seller_product_stock(request, product_id):
             return Response({'error': 'Invalid stock quantity'}, status=status.HTTP_400_BAD_REQUEST)
         
         product.stock_quantity = new_stock
-        product.save()
+        product.save(update_fields=['stock_quantity', 'updated_at'])
         
         return Response({
             'status': 'success',
@@ -2763,8 +3081,6 @@ def update_seller_variant_stock(request, product_id, variant_id):
                        status=status.HTTP_403_FORBIDDEN)
     
     try:
-        from products.models import ProductCategoryVariantOption
-        
         # Verify product belongs to seller
         product = Product.objects.get(id=product_id, seller=request.user)
         
@@ -2784,7 +3100,7 @@ def update_seller_variant_stock(request, product_id, variant_id):
             return Response({'error': 'Valid stock quantity is required'}, status=status.HTTP_400_BAD_REQUEST)
         
         variant.stock_count = new_stock
-        variant.save()
+        variant.save(update_fields=['stock_count', 'updated_at'])
         
         return Response({
             'status': 'success',
@@ -2878,6 +3194,8 @@ def bulk_edit_seller_products(request):
             return Response({'error': 'No valid products found'}, status=status.HTTP_404_NOT_FOUND)
         
         updated_count = 0
+        update_fields = [field for field in ('is_active', 'base_price', 'stock_quantity') if field in update_data]
+        update_fields.append('updated_at')
         for product in products:
             if 'is_active' in update_data:
                 product.is_active = update_data['is_active']
@@ -2886,7 +3204,7 @@ def bulk_edit_seller_products(request):
             if 'stock_quantity' in update_data:
                 product.stock_quantity = update_data['stock_quantity']
             
-            product.save()
+            product.save(update_fields=update_fields)
             updated_count += 1
         
         return Response({
@@ -2977,7 +3295,6 @@ def seller_product_analytics(request):
             .order_by('-total_sold')[:5]
         
         # Monthly sales data (last 12 months)
-        from datetime import datetime, timedelta
         from dateutil.relativedelta import relativedelta
         
         monthly_data = []
@@ -3029,9 +3346,6 @@ def seller_product_analytics(request):
 def seller_requests_list(request):
     """Get all seller requests (offers, featured products, and ad bookings)"""
     try:
-        from products.models import SellerOfferRequest, SellerFeaturedRequest
-        from .models import AdBookingRequest
-        
         # Get offer requests with related data
         offer_requests = SellerOfferRequest.objects.select_related(
             'product', 'seller', 'reviewed_by'
@@ -3166,8 +3480,6 @@ def seller_requests_list(request):
 def mark_payment_completed(request, request_id):
     """Mark seller request payment as completed"""
     try:
-        from products.models import SellerOfferRequest, SellerFeaturedRequest
-        
         request_type = request.data.get('request_type')  # 'offer' or 'featured'
         payment_reference = request.data.get('payment_reference')
         admin_notes = request.data.get('admin_notes', '')
@@ -3190,11 +3502,10 @@ def mark_payment_completed(request, request_id):
         seller_request.save()
         
         # Log admin activity
-        AdminActivity.objects.create(
-            admin=request.user,
-            action='mark_payment_completed',
-            description=f'Marked payment completed for {request_type} request #{request_id}',
-            ip_address=get_client_ip(request)
+        log_admin_activity(
+            request,
+            'mark_payment_completed',
+            f'Marked payment completed for {request_type} request #{request_id}'
         )
         
         return Response({
@@ -3211,8 +3522,6 @@ def mark_payment_completed(request, request_id):
 def approve_offer_request(request, request_id):
     """Approve offer request and create actual ProductOffer"""
     try:
-        from products.models import SellerOfferRequest
-        
         offer_request = get_object_or_404(SellerOfferRequest, id=request_id)
         
         # Use the model's built-in approval method
@@ -3220,11 +3529,10 @@ def approve_offer_request(request, request_id):
         
         if product_offer:
             # Log admin activity
-            AdminActivity.objects.create(
-                admin=request.user,
-                action='approve_offer_request',
-                description=f'Approved offer request #{request_id} and created ProductOffer #{product_offer.id}',
-                ip_address=get_client_ip(request)
+            log_admin_activity(
+                request,
+                'approve_offer_request',
+                f'Approved offer request #{request_id} and created ProductOffer #{product_offer.id}'
             )
             
             return Response({
@@ -3246,8 +3554,6 @@ def approve_offer_request(request, request_id):
 def approve_featured_request(request, request_id):
     """Approve featured request and create actual FeaturedProduct"""
     try:
-        from products.models import SellerFeaturedRequest
-        
         featured_request = get_object_or_404(SellerFeaturedRequest, id=request_id)
         
         # Use the model's built-in approval method
@@ -3255,11 +3561,10 @@ def approve_featured_request(request, request_id):
         
         if featured_product:
             # Log admin activity
-            AdminActivity.objects.create(
-                admin=request.user,
-                action='approve_featured_request',
-                description=f'Approved featured request #{request_id} and created FeaturedProduct #{featured_product.id}',
-                ip_address=get_client_ip(request)
+            log_admin_activity(
+                request,
+                'approve_featured_request',
+                f'Approved featured request #{request_id} and created FeaturedProduct #{featured_product.id}'
             )
             
             return Response({
@@ -3281,10 +3586,6 @@ def approve_featured_request(request, request_id):
 def mark_payment_and_auto_approve(request, request_id):
     """Mark payment completed and automatically approve request"""
     try:
-        from products.models import SellerOfferRequest, SellerFeaturedRequest
-        import logging
-        logger = logging.getLogger(__name__)
-        
         request_type = request.data.get('request_type')  # 'offer' or 'featured'
         payment_reference = request.data.get('payment_reference')
         admin_notes = request.data.get('admin_notes', '')
@@ -3326,11 +3627,10 @@ def mark_payment_and_auto_approve(request, request_id):
         
         if created_item:
             # Log admin activity
-            AdminActivity.objects.create(
-                admin=request.user,
-                action='mark_payment_and_auto_approve',
-                description=f'Payment completed and auto-approved {request_type} request #{request_id}, created {item_type} #{created_item.id}',
-                ip_address=get_client_ip(request)
+            log_admin_activity(
+                request,
+                'mark_payment_and_auto_approve',
+                f'Payment completed and auto-approved {request_type} request #{request_id}, created {item_type} #{created_item.id}'
             )
             
             return Response({
@@ -3344,8 +3644,6 @@ def mark_payment_and_auto_approve(request, request_id):
             }, status=status.HTTP_400_BAD_REQUEST)
             
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Exception in mark_payment_and_auto_approve: {str(e)}", exc_info=True)
         return Response({'error': f'An error occurred: {str(e)}'}, status=status.HTTP_400_BAD_REQUEST)
 
@@ -3359,8 +3657,6 @@ def mark_payment_and_auto_approve(request, request_id):
 def get_ad_types(request):
     """Get all active ad types for booking form"""
     try:
-        from .models import AdType, AdPricing
-        
         ad_types = AdType.objects.filter(is_active=True).prefetch_related('pricing')
         
         data = []
@@ -3400,8 +3696,6 @@ def get_ad_types(request):
 def create_ad_booking(request):
     """Create a new ad booking request"""
     try:
-        from .models import AdType, AdBookingRequest, AdPricing
-        
         # Check if user is a seller (artist or store)
         is_seller = (
             request.user.user_type in ['artist', 'store'] and
@@ -3521,8 +3815,6 @@ def create_ad_booking(request):
         }, status=status.HTTP_201_CREATED)
     
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Error creating ad booking: {str(e)}", exc_info=True)
         return Response({
             'error': f'An error occurred while creating booking: {str(e)}'
@@ -3534,8 +3826,6 @@ def create_ad_booking(request):
 def update_ad_type_requirements(request, ad_type_id):
     """Get or update requirements for a specific ad type"""
     try:
-        from .models import AdType
-        
         # Check if user is admin
         if not request.user.is_staff:
             return JsonResponse({
@@ -3566,7 +3856,6 @@ def update_ad_type_requirements(request, ad_type_id):
         
         elif request.method == 'POST':
             # Update requirements
-            import json
             
             # Get requirements from POST data
             requirements_str = request.POST.get('requirements')
@@ -3610,8 +3899,6 @@ def update_ad_type_requirements(request, ad_type_id):
             })
         
     except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
         logger.error(f"Error managing ad type requirements: {e}", exc_info=True)
         return JsonResponse({
             'success': False,
@@ -3687,7 +3974,6 @@ def approve_ad_booking(request, booking_id):
     """Admin endpoint to approve ad booking and create advertisement"""
     try:
         from .content_models import AdBookingRequest
-        from datetime import timedelta
         
         booking = get_object_or_404(AdBookingRequest, id=booking_id)
         
@@ -3725,7 +4011,7 @@ def approve_ad_booking(request, booking_id):
                 elif booking.duration == 'monthly':
                     booking.end_date = booking.start_date + timedelta(days=30)
             
-            booking.save()
+            booking.save(update_fields=['status', 'ad_title', 'ad_description', 'admin_notes', 'approved_at', 'start_date', 'end_date', 'updated_at'])
             
             # Create the actual advertisement
             ad = Advertisement.objects.create(
@@ -3741,11 +4027,10 @@ def approve_ad_booking(request, booking_id):
             )
             
             # Log admin activity
-            AdminActivity.objects.create(
-                admin=request.user,
-                action='approve',
-                description=f'Approved ad booking #{booking_id} and created advertisement #{ad.id}',
-                ip_address=get_client_ip(request)
+            log_admin_activity(
+                request,
+                'approve',
+                f'Approved ad booking #{booking_id} and created advertisement #{ad.id}'
             )
         
         return Response({
@@ -3776,14 +4061,13 @@ def reject_ad_booking(request, booking_id):
         
         booking.status = 'rejected'
         booking.admin_notes = admin_notes
-        booking.save()
+        booking.save(update_fields=['status', 'admin_notes', 'updated_at'])
         
         # Log admin activity
-        AdminActivity.objects.create(
-            admin=request.user,
-            action='reject',
-            description=f'Rejected ad booking #{booking_id}',
-            ip_address=get_client_ip(request)
+        log_admin_activity(
+            request,
+            'reject',
+            f'Rejected ad booking #{booking_id}'
         )
         
         return Response({
@@ -3801,7 +4085,6 @@ def reject_ad_booking(request, booking_id):
 @permission_classes([IsAuthenticated, IsAdminUser])
 def ad_booking_detail_api(request, booking_id):
     """Get detailed information about an ad booking"""
-    from .models import AdBookingRequest
     
     try:
         booking = AdBookingRequest.objects.select_related(
@@ -3842,7 +4125,6 @@ def ad_booking_detail_api(request, booking_id):
 @permission_classes([IsAuthenticated, IsAdminUser])
 def approve_ad_booking_api(request, booking_id):
     """Approve an ad booking request"""
-    from .models import AdBookingRequest
     
     try:
         booking = AdBookingRequest.objects.get(id=booking_id)
@@ -3854,7 +4136,7 @@ def approve_ad_booking_api(request, booking_id):
             }, status=status.HTTP_400_BAD_REQUEST)
         
         booking.status = 'approved'
-        booking.save()
+        booking.save(update_fields=['status', 'updated_at'])
         
         return Response({
             'success': True,
@@ -3871,8 +4153,6 @@ def approve_ad_booking_api(request, booking_id):
 @permission_classes([IsAuthenticated, IsAdminUser])
 def activate_ad_booking_api(request, booking_id):
     """Activate an approved ad booking and create corresponding advertisement"""
-    from .models import AdBookingRequest
-    from django.db import transaction
     
     try:
         booking = AdBookingRequest.objects.get(id=booking_id)
@@ -3887,8 +4167,6 @@ def activate_ad_booking_api(request, booking_id):
         with transaction.atomic():
             # Update booking status and dates
             booking.status = 'active'
-            from datetime import datetime, timedelta
-            from django.utils import timezone
             now = timezone.now()
             booking.start_date = now
             
@@ -3904,7 +4182,7 @@ def activate_ad_booking_api(request, booking_id):
             else:
                 booking.end_date = now + timedelta(days=duration_value)
                 
-            booking.save()
+            booking.save(update_fields=['status', 'start_date', 'end_date', 'updated_at'])
             
             # Auto-create advertisement based on ad type
             ad_created = _create_advertisement_from_booking(booking)
@@ -3932,7 +4210,6 @@ def _create_advertisement_from_booking(booking):
         
         if ad_type == 'home_slider' or ad_type == 'category_slider':
             # Create Advertisement for sliders
-            from products.models import Advertisement
             
             advertisement = Advertisement.objects.create(
                 title=booking.ad_title or f"إعلان {booking.ad_type.name_ar}",
@@ -3946,7 +4223,6 @@ def _create_advertisement_from_booking(booking):
             
         elif ad_type == 'offer_ad' and booking.product_id:
             # Create ProductOffer
-            from products.models import ProductOffer, Product
             
             try:
                 product = Product.objects.get(id=booking.product_id)
@@ -3976,7 +4252,6 @@ def _create_advertisement_from_booking(booking):
                 
         elif ad_type == 'featured_product' and booking.product_id:
             # Create FeaturedProduct
-            from products.models import FeaturedProduct, Product
             
             try:
                 product = Product.objects.get(id=booking.product_id)
@@ -4005,7 +4280,7 @@ def _create_advertisement_from_booking(booking):
         return False
         
     except Exception as e:
-        print(f"Error creating advertisement from booking: {e}")
+        logger.error("Error creating advertisement from booking: %s", e)
         return False
 
 
@@ -4013,7 +4288,6 @@ def _create_advertisement_from_booking(booking):
 @permission_classes([IsAuthenticated, IsAdminUser])
 def reject_ad_booking_api(request, booking_id):
     """Reject an ad booking request"""
-    from .models import AdBookingRequest
     
     try:
         booking = AdBookingRequest.objects.get(id=booking_id)
@@ -4029,7 +4303,7 @@ def reject_ad_booking_api(request, booking_id):
         if reason:
             current_notes = booking.admin_notes or ''
             booking.admin_notes = f"{current_notes}\n\nRejection reason: {reason}".strip()
-        booking.save()
+        booking.save(update_fields=['status', 'admin_notes', 'updated_at'])
         
         return Response({
             'success': True,
@@ -4046,14 +4320,13 @@ def reject_ad_booking_api(request, booking_id):
 @permission_classes([IsAuthenticated, IsAdminUser])
 def update_ad_booking_notes_api(request, booking_id):
     """Update admin notes for an ad booking"""
-    from .models import AdBookingRequest
     
     try:
         booking = AdBookingRequest.objects.get(id=booking_id)
         notes = request.data.get('notes', '')
         
         booking.admin_notes = notes
-        booking.save()
+        booking.save(update_fields=['admin_notes', 'updated_at'])
         
         return Response({
             'success': True,
@@ -4069,7 +4342,7 @@ def update_ad_booking_notes_api(request, booking_id):
 # USER NOTIFICATION MANAGEMENT VIEWS
 # ========================
 
-class UserNotificationListView(generics.ListAPIView):
+class UserNotificationListView(AdminListPaginationMixin, generics.ListAPIView):
     """List all user notifications for admin management"""
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
@@ -4192,19 +4465,16 @@ def send_bulk_notification_api(request):
             users = User.objects.filter(is_active=True)
         elif target_audience == 'active':
             # Users who have logged in recently (within last 30 days)
-            from datetime import datetime, timedelta
             thirty_days_ago = datetime.now() - timedelta(days=30)
             users = User.objects.filter(is_active=True, last_login__gte=thirty_days_ago)
         elif target_audience == 'sellers':
             # Users who are sellers (have seller applications or user_type is seller)
-            from django.db.models import Q
             users = User.objects.filter(is_active=True).filter(
                 Q(user_type='seller') | 
                 Q(sellerapplication__isnull=False)
             ).distinct()
         elif target_audience == 'customers':
             # Users who are not sellers
-            from django.db.models import Q
             users = User.objects.filter(is_active=True).exclude(
                 Q(user_type='seller') | 
                 Q(sellerapplication__isnull=False)
@@ -4247,7 +4517,7 @@ def send_bulk_notification_api(request):
                 sent_count += 1
             except Exception as e:
                 failed_count += 1
-                print(f"Failed to send notification to {user.email}: {e}")
+                logger.warning("Failed to send notification to %s: %s", user.email, e)
         
         return Response({
             'success': True,
@@ -4278,7 +4548,6 @@ def notification_stats_api(request):
         push_sent_count = UserNotification.objects.filter(push_sent=True).count()
         
         # Recent notifications (last 7 days)
-        from datetime import timedelta
         week_ago = timezone.now() - timedelta(days=7)
         recent_notifications = UserNotification.objects.filter(created_at__gte=week_ago).count()
         
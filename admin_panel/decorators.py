@@ -1,3 +1,4 @@
+import ipaddress
 from functools import wraps
 from django.shortcuts import redirect
 from django.contrib.auth.decorators import login_required
@@ -28,6 +29,19 @@ def admin_required(permission_name=None):
         return wrapped_view
     return decorator
 
+def get_client_ip(request):
+    """Get client IP address from request, preferring the address set by the nginx proxy"""
+    # nginx overwrites X-Real-IP and appends the peer to X-Forwarded-For, so only those are
+    # trusted over the socket address. Values that aren't an IP are skipped, since they would
+    # fail the activity log insert and roll back the admin action with it
+    forwarded = request.META.get('HTTP_X_FORWARDED_FOR', '').split(',')
+    for candidate in (request.META.get('HTTP_X_REAL_IP'), forwarded[-1], request.META.get('REMOTE_ADDR')):
+        try:
+            return str(ipaddress.ip_address((candidate or '').strip()))
+        except ValueError:
+            continue
+    return None
+
 def is_admin(user):
     """Check if user is admin"""
     if user.is_staff or user.is_superuser:
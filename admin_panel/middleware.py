@@ -3,6 +3,7 @@ from django.urls import resolve
 from django.contrib import messages
 import re
 from .models import AdminActivity
+from .decorators import get_client_ip
 
 def is_admin(user):
     """Helper function to check if user is admin - same as in views.py"""
@@ -56,7 +57,7 @@ class AdminActivityMiddleware:
                     admin=request.user,
                     action='login',
                     description=f"Admin login: {request.user.email}",
-                    ip_address=request.META.get('REMOTE_ADDR')
+                    ip_address=get_client_ip(request)
                 )
         
         # Track logout
@@ -67,7 +68,7 @@ class AdminActivityMiddleware:
                     admin=user,
                     action='logout',
                     description=f"Admin logout: {user.email}",
-                    ip_address=request.META.get('REMOTE_ADDR')
+                    ip_address=get_client_ip(request)
                 )
         
         return response
\ No newline at end of file
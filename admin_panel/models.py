@@ -26,6 +26,10 @@ class AdminActivity(models.Model):
         verbose_name = 'Admin Activity'
         verbose_name_plural = 'Admin Activities'
         ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['admin', '-timestamp']),
+            models.Index(fields=['action', '-timestamp']),
+        ]
     
     def __str__(self):
         return f"{self.admin.email} - {self.action} - {self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
@@ -46,6 +50,11 @@ class AdminNotification(models.Model):
     link = models.CharField(max_length=255, blank=True, null=True)  # Link to relevant page
     created_at = models.DateTimeField(auto_now_add=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['is_read', '-created_at']),
+        ]
+    
     def __str__(self):
         return f"{self.notification_type}: {self.title}"
 
@@ -1,3 +1,5 @@
+import copy
+
 from rest_framework import serializers
 from custom_auth.models import User, Artist, Store
 from products.models import Product, Category
@@ -6,7 +8,21 @@ from .models import AdminActivity, AdminNotification
 from custom_auth.models import SellerApplication
 from django.utils import timezone
 
-class SellerApplicationSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """
+    Build a ModelSerializer's fields once per class instead of introspecting the model
+    on every instantiation; each instance still gets its own copies of the fields.
+    """
+    _fields_cache = {}
+    
+    def get_fields(self):
+        cls = type(self)
+        fields = CachedFieldsMixin._fields_cache.get(cls)
+        if fields is None:
+            fields = CachedFieldsMixin._fields_cache[cls] = super().get_fields()
+        return copy.deepcopy(fields)
+
+class SellerApplicationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     user_email = serializers.EmailField(source='user.email', read_only=True)
     user_name = serializers.SerializerMethodField()
     status_display = serializers.CharField(source='get_status_display', read_only=True)
@@ -21,7 +37,7 @@ class SellerApplicationSerializer(serializers.ModelSerializer):
         user = obj.user
         return f"{user.first_name} {user.last_name}".strip() or user.email
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     full_name = serializers.SerializerMethodField()
     user_type_display = serializers.CharField(source='get_user_type_display', read_only=True)
     blocked_by_email = serializers.EmailField(source='blocked_by.email', read_only=True, allow_null=True, default=None)
@@ -43,7 +59,7 @@ class CategorySerializer(serializers.ModelSerializer):
         model = Category
         fields = ('id', 'name')
 
-class ProductSerializer(serializers.ModelSerializer):
+class ProductSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     seller_name = serializers.SerializerMethodField()
     category_name = serializers.CharField(source='category.name', read_only=True)
     
@@ -67,18 +83,18 @@ class ProductSerializer(serializers.ModelSerializer):
                 return f"Store: {user.email}"
         return user.email
 
-class OrderItemSerializer(serializers.ModelSerializer):
+class OrderItemSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     product_name = serializers.CharField(source='product.name', read_only=True)
     
     class Meta:
         model = OrderItem
         fields = ('id', 'product', 'product_name', 'quantity', 'price')
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     user_email = serializers.EmailField(source='user.email', read_only=True)
     user_name = serializers.SerializerMethodField()
     status_display = serializers.CharField(source='get_status_display', read_only=True)
-    items = OrderItemSerializer(source='items', many=True, read_only=True)
+    items = OrderItemSerializer(many=True, read_only=True)
     
     class Meta:
         model = Order
@@ -91,7 +107,7 @@ class OrderSerializer(serializers.ModelSerializer):
         user = obj.user
         return f"{user.first_name} {user.last_name}".strip() or user.email
 
-class AdminActivitySerializer(serializers.ModelSerializer):
+class AdminActivitySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     admin_email = serializers.EmailField(source='admin.email', read_only=True)
     action_display = serializers.CharField(source='get_action_display', read_only=True)
     
@@ -100,7 +116,7 @@ class AdminActivitySerializer(serializers.ModelSerializer):
         fields = ('id', 'admin', 'admin_email', 'action', 'action_display',
                   'description', 'ip_address', 'timestamp')
 
-class AdminNotificationSerializer(serializers.ModelSerializer):
+class AdminNotificationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     notification_type_display = serializers.CharField(source='get_notification_type_display', read_only=True)
     
     class Meta:
@@ -1,3 +1,68 @@
+from unittest import mock
+
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from .api_views import AdminPagination
+from .models import AdminNotification
+
+
+class EstimatedCountPaginationTests(TestCase):
+    """AdminPagination on a table large enough to use the row estimate instead of COUNT(*)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        AdminNotification.objects.bulk_create([
+            AdminNotification(title=f'Notification {i}', message='message', notification_type='system')
+            for i in range(45)
+        ])
+
+    def setUp(self):
+        # Exact counts are cached per query; start every test from a cold cache
+        cache.clear()
+
+    def paginate(self, **params):
+        request = Request(APIRequestFactory().get('/api/admin/notifications/', params))
+        pagination = AdminPagination()
+        rows = pagination.paginate_queryset(AdminNotification.objects.order_by('-id'), request)
+        return pagination, rows
+
+    @mock.patch('admin_panel.api_views.estimated_row_count', return_value=500000)
+    def test_estimated_path_reads_only_the_page(self, estimate):
+        with self.assertNumQueries(1):
+            pagination, rows = self.paginate(page=2)
+            response = pagination.get_paginated_response([row.id for row in rows])
+
+        self.assertEqual(response.data['count'], 500000)
+        self.assertEqual(len(response.data['results']), 20)
+        self.assertIsNotNone(response.data['next'])
+        self.assertIsNotNone(response.data['previous'])
+
+    @mock.patch('admin_panel.api_views.estimated_row_count', return_value=500000)
+    def test_estimated_path_ends_where_the_rows_end(self, estimate):
+        with self.assertNumQueries(1):
+            pagination, rows = self.paginate(page=3)
+            response = pagination.get_paginated_response([row.id for row in rows])
+
+        self.assertEqual(len(response.data['results']), 5)
+        self.assertIsNone(response.data['next'])
+
+        with self.assertRaises(NotFound):
+            self.paginate(page=4)
+
+    @mock.patch('admin_panel.api_views.estimated_row_count', return_value=500000)
+    def test_estimated_path_has_no_last_page(self, estimate):
+        with self.assertNumQueries(0):
+            with self.assertRaises(NotFound):
+                self.paginate(page='last')
+
+    @mock.patch('admin_panel.api_views.estimated_row_count', return_value=None)
+    def test_small_table_counts_exactly(self, estimate):
+        pagination, rows = self.paginate(page='last')
+        response = pagination.get_paginated_response([row.id for row in rows])
 
-# Create your tests here.
+        self.assertEqual(response.data['count'], 45)
+        self.assertEqual(len(response.data['results']), 5)
@@ -21,7 +21,7 @@ from products.models import Product, Category, ProductImage
 from .models import AdminActivity, AdminNotification, AdBookingRequest, AdType, AdPricing
 from orders.models import Order
 from .models import AdminActivity, AdminNotification
-from .decorators import admin_required, has_admin_permission
+from .decorators import admin_required, has_admin_permission, get_client_ip
 from notifications.models import Notification, BulkNotification
 from support.models import ContactRequest, ContactNote, ContactStats
 
@@ -62,7 +62,7 @@ def admin_login(request):
                 admin=user,
                 action='login',
                 description=f"Admin logged in: {user.email}",
-                ip_address=request.META.get('REMOTE_ADDR')
+                ip_address=get_client_ip(request)
             )
             
             next_url = request.POST.get('next', '')
@@ -83,7 +83,7 @@ def admin_logout(request):
             admin=request.user,
             action='logout',
             description=f"Admin logged out: {request.user.email}",
-            ip_address=request.META.get('REMOTE_ADDR')
+            ip_address=get_client_ip(request)
         )
     
     logout(request)
@@ -322,7 +322,7 @@ def process_application(request, application_id):
                 admin=request.user,
                 action='approve',
                 description=f"Approved seller application #{application.id} for {application.business_name}",
-                ip_address=request.META.get('REMOTE_ADDR')
+                ip_address=get_client_ip(request)
             )
 
             # Send notification to user
@@ -351,7 +351,7 @@ def process_application(request, application_id):
                 admin=request.user,
                 action='reject',
                 description=f"Rejected seller application #{application.id} for {application.business_name}",
-                ip_address=request.META.get('REMOTE_ADDR')
+                ip_address=get_client_ip(request)
             )
 
             # Send notification to user
@@ -380,7 +380,7 @@ def process_application(request, application_id):
                 admin=request.user,
                 action='reject',
                 description=f"Permanently rejected seller application #{application.id} for {application.business_name}",
-                ip_address=request.META.get('REMOTE_ADDR')
+                ip_address=get_client_ip(request)
             )
 
             messages.warning(request, f"Application #{application.id} has been permanently rejected.")
@@ -574,7 +574,7 @@ def process_product_approval(request, product_id):
             admin=request.user,
             action='approve_product',
             description=f'Approved product "{product.name}" (ID: {product.id}) by {product.seller.email}',
-            ip_address=request.META.get('REMOTE_ADDR')
+            ip_address=get_client_ip(request)
         )
 
         messages.success(request, f'تم قبول المنتج "{product.name}" بنجاح')
@@ -601,7 +601,7 @@ def process_product_approval(request, product_id):
             admin=request.user,
             action='reject_product',
             description=f'Rejected product "{product.name}" (ID: {product.id}) by {product.seller.email}. Reason: {rejection_reason}',
-            ip_address=request.META.get('REMOTE_ADDR')
+            ip_address=get_client_ip(request)
         )
 
         messages.success(request, f'تم رفض المنتج "{product.name}" بنجاح')
@@ -631,7 +631,7 @@ def process_product_approval(request, product_id):
             admin=request.user,
             action='approve_featured_request',
             description=f'Approved featured request for product "{product.name}" (ID: {product.id})',
-            ip_address=request.META.get('REMOTE_ADDR')
+            ip_address=get_client_ip(request)
         )
 
         messages.success(request, f'تم قبول طلب المنتج المميز لـ "{product.name}"')
@@ -653,7 +653,7 @@ def process_product_approval(request, product_id):
             admin=request.user,
             action='reject_featured_request',
             description=f'Rejected featured request for product "{product.name}" (ID: {product.id})',
-            ip_address=request.META.get('REMOTE_ADDR')
+            ip_address=get_client_ip(request)
         )
 
         messages.success(request, f'تم رفض طلب المنتج المميز لـ "{product.name}"')
@@ -691,7 +691,7 @@ def process_product_approval(request, product_id):
             admin=request.user,
             action='approve_offers_request',
             description=f'Approved latest offers request for product "{product.name}" (ID: {product.id})',
-            ip_address=request.META.get('REMOTE_ADDR')
+            ip_address=get_client_ip(request)
         )
 
         messages.success(request, f'تم قبول طلب العروض الحديثة لـ "{product.name}"')
@@ -713,7 +713,7 @@ def process_product_approval(request, product_id):
             admin=request.user,
             action='reject_offers_request',
             description=f'Rejected latest offers request for product "{product.name}" (ID: {product.id})',
-            ip_address=request.META.get('REMOTE_ADDR')
+            ip_address=get_client_ip(request)
         )
 
         messages.success(request, f'تم رفض طلب العروض الحديثة لـ "{product.name}"')
@@ -977,7 +977,7 @@ def view_user_profile(request, user_id):
         admin=request.user,
         action='other',
         description=f"Viewed profile of user: {user.email}",
-        ip_address=request.META.get('REMOTE_ADDR')
+        ip_address=get_client_ip(request)
     )
 
     # Determine which admin page to redirect to based on user type
@@ -1020,7 +1020,7 @@ def view_order(request, order_id):
         admin=request.user,
         action='other',
         description=f"Viewed order #{order.id}",
-        ip_address=request.META.get('REMOTE_ADDR')
+        ip_address=get_client_ip(request)
     )
 
     # Redirect to the order admin page
@@ -1175,7 +1175,7 @@ def create_subcategory_section_api(request):
             admin=request.user,
             action='create',
             description=f"Created section control for subcategory '{subcategory.name}'",
-            ip_address=request.META.get('REMOTE_ADDR')
+            ip_address=get_client_ip(request)
         )
         
         return JsonResponse({
@@ -1212,7 +1212,7 @@ def toggle_subcategory_section_api(request, section_id):
             admin=request.user,
             action='update',
             description=f"{action.capitalize()} section for subcategory '{section_control.subcategory.name}'",
-            ip_address=request.META.get('REMOTE_ADDR')
+            ip_address=get_client_ip(request)
         )
         
         return JsonResponse({
@@ -1255,7 +1255,7 @@ def update_subcategory_section_api(request, section_id):
             admin=request.user,
             action='update',
             description=f"Updated section settings for subcategory '{section_control.subcategory.name}'",
-            ip_address=request.META.get('REMOTE_ADDR')
+            ip_address=get_client_ip(request)
         )
         
         return JsonResponse({
@@ -1286,7 +1286,7 @@ def delete_subcategory_section_api(request, section_id):
             admin=request.user,
             action='delete',
             description=f"Deleted section control for subcategory '{subcategory_name}'",
-            ip_address=request.META.get('REMOTE_ADDR')
+            ip_address=get_client_ip(request)
         )
         
         return JsonResponse({
@@ -1312,7 +1312,7 @@ def add_product_with_variants(request):
         admin=request.user,
         action='other',
         description="Accessed add product with variants page",
-        ip_address=request.META.get('REMOTE_ADDR')
+        ip_address=get_client_ip(request)
     )
 
     return render(request, 'admin_panel/add_product_with_variants.html', context)
@@ -1334,7 +1334,7 @@ def edit_product_with_variants(request, product_id):
         admin=request.user,
         action='other',
         description=f"Accessed edit product with variants page for product: {product.name}",
-        ip_address=request.META.get('REMOTE_ADDR')
+        ip_address=get_client_ip(request)
     )
 
     return render(request, 'admin_panel/edit_product_with_variants.html', context)
@@ -1861,7 +1861,7 @@ def admin_management(request):
         admin=request.user,
         action='other',
         description="Accessed admin management page",
-        ip_address=request.META.get('REMOTE_ADDR')
+        ip_address=get_client_ip(request)
     )
     
     return render(request, 'admin_panel/admin_management.html', context)
@@ -1943,7 +1943,7 @@ def create_admin_user(request):
                 admin=request.user,
                 action='create',
                 description=f"Created admin user: {email} with role: {role.display_name}",
-                ip_address=request.META.get('REMOTE_ADDR')
+                ip_address=get_client_ip(request)
             )
         except Exception as log_error:
             # Don't fail user creation if logging fails
@@ -2057,7 +2057,7 @@ def update_admin_user(request, admin_id):
             admin=request.user,
             action='update',
             description=f"Updated admin user: {user.email}",
-            ip_address=request.META.get('REMOTE_ADDR')
+            ip_address=get_client_ip(request)
         )
         
         return JsonResponse({
@@ -2106,7 +2106,7 @@ def delete_admin_user(request, admin_id):
             admin=request.user,
             action='delete',
             description=f"Deleted admin user: {user_email}",
-            ip_address=request.META.get('REMOTE_ADDR')
+            ip_address=get_client_ip(request)
         )
         
         return JsonResponse({
@@ -2272,7 +2272,7 @@ def update_ad_pricing_api(request, ad_type_id):
             admin=request.user,
             action="update",
             description=f"Updated pricing for ad type {ad_type.get_name_display()}",
-            ip_address=request.META.get("REMOTE_ADDR")
+            ip_address=get_client_ip(request)
         )
         
         return JsonResponse({
@@ -2305,7 +2305,7 @@ def toggle_ad_type_api(request, ad_type_id):
             admin=request.user,
             action="toggle",
             description=f"{'Activated' if ad_type.is_active else 'Deactivated'} ad type {ad_type.get_name_display()}",
-            ip_address=request.META.get("REMOTE_ADDR")
+            ip_address=get_client_ip(request)
         )
         
         return JsonResponse({
@@ -2354,7 +2354,7 @@ def reset_ad_pricing_api(request):
             admin=request.user,
             action="reset",
             description=f"Reset all ad pricing to defaults ({updated_count} pricing rules)",
-            ip_address=request.META.get("REMOTE_ADDR")
+            ip_address=get_client_ip(request)
         )
         
         return JsonResponse({
@@ -2421,7 +2421,7 @@ def bulk_update_ad_pricing_api(request):
             admin=request.user,
             action="bulk_update",
             description=f"Applied bulk pricing changes: {message}",
-            ip_address=request.META.get("REMOTE_ADDR")
+            ip_address=get_client_ip(request)
         )
         
         return JsonResponse({
@@ -2522,7 +2522,7 @@ def approve_ad_booking_api(request, booking_id):
                 admin=request.user,
                 action="approve",
                 description=f"Approved ad booking #{booking.id} for {booking.seller.email} and created {ad_created['type']} #{ad_created['id']}",
-                ip_address=request.META.get("REMOTE_ADDR")
+                ip_address=get_client_ip(request)
             )
         
         return JsonResponse({
@@ -2572,7 +2572,7 @@ def activate_ad_booking_api(request, booking_id):
             admin=request.user,
             action="activate",
             description=f"Activated ad booking #{booking.id} for {booking.seller.email}",
-            ip_address=request.META.get("REMOTE_ADDR")
+            ip_address=get_client_ip(request)
         )
         
         return JsonResponse({
@@ -2616,7 +2616,7 @@ def reject_ad_booking_api(request, booking_id):
             admin=request.user,
             action="reject",
             description=f"Rejected ad booking #{booking.id} for {booking.seller.email}. Reason: {rejection_reason}",
-            ip_address=request.META.get("REMOTE_ADDR")
+            ip_address=get_client_ip(request)
         )
         
         return JsonResponse({
@@ -2651,7 +2651,7 @@ def update_ad_booking_notes_api(request, booking_id):
             admin=request.user,
             action="update",
             description=f"Updated notes for ad booking #{booking.id}",
-            ip_address=request.META.get("REMOTE_ADDR")
+            ip_address=get_client_ip(request)
         )
         
         return JsonResponse({
@@ -9,6 +9,7 @@ from django.db.models import Q
 from .models import User, Artist, Store
 from .serializers import UserSerializer
 from admin_panel.models import AdminActivity, AdminNotification
+from admin_panel.activity_log import log_admin_activity
 from .models import SellerApplication
 import logging
 
@@ -74,12 +75,7 @@ def block_unblock_user(request, user_id):
     target_user.save()
     
     # Log admin activity
-    AdminActivity.objects.create(
-        admin=request.user,
-        action=admin_action,
-        description=action_description,
-        ip_address=request.META.get('REMOTE_ADDR')
-    )
+    log_admin_activity(request, admin_action, action_description)
     
     return Response({
         'status': 'success',
@@ -58,6 +58,11 @@ class User(AbstractUser):
 
     objects = CustomUserManager()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user_type', '-date_joined']),
+        ]
+
     def __str__(self):
         return self.email
 
@@ -173,6 +178,9 @@ class SellerApplication(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', '-created_at']),
+        ]
     
     def __str__(self):
         return f"{self.seller_type.title()} Application: {self.business_name} ({self.user.email}) - {self.status}"
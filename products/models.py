@@ -1,6 +1,7 @@
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.conf import settings
+from django.core.cache import cache
 from django.db.models import Q
 from decimal import Decimal
 from django.utils.translation import gettext_lazy as _
@@ -160,6 +161,13 @@ class Product(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['is_active', '-created_at']),
+            models.Index(fields=['category', '-created_at']),
+            models.Index(fields=['category', 'is_active', '-created_at']),
+        ]
+    
     def __str__(self):
         return self.name
     
@@ -320,6 +328,10 @@ class Review(models.Model):
         unique_together = ('product', 'user')
 
 
+# Cache key for the public ads slider payload, cleared by products.signals
+ACTIVE_ADS_CACHE_KEY = 'active_ads'
+
+
 class Advertisement(models.Model):
     """Model for managing ads slider in the app"""
     title = models.CharField(max_length=200, verbose_name=_('Title'))
@@ -357,6 +369,7 @@ class Advertisement(models.Model):
             models.Index(fields=['is_active', 'show_on_main']),
             models.Index(fields=['category', 'is_active']),
             models.Index(fields=['order']),
+            models.Index(fields=['is_active', 'order', '-created_at']),
         ]
     
     def __str__(self):
@@ -393,6 +406,11 @@ class Advertisement(models.Model):
         return " & ".join(locations) if locations else "Inactive"
 
 
+# Cache key for the ContentSettings singleton, cleared by products.signals on change
+CONTENT_SETTINGS_CACHE_KEY = 'content_settings'
+CONTENT_SETTINGS_CACHE_TIMEOUT = 300  # seconds; a safety net, the signals clear it on change
+
+
 class ContentSettings(models.Model):
     """Model for managing app content display settings"""
     
@@ -435,8 +453,11 @@ class ContentSettings(models.Model):
     
     @classmethod
     def get_settings(cls):
-        """Get or create the content settings instance"""
-        settings, created = cls.objects.get_or_create(pk=1)
+        """Get or create the content settings instance, served from the cache between changes"""
+        settings = cache.get(CONTENT_SETTINGS_CACHE_KEY)
+        if settings is None:
+            settings, created = cls.objects.get_or_create(pk=1)
+            cache.set(CONTENT_SETTINGS_CACHE_KEY, settings, timeout=CONTENT_SETTINGS_CACHE_TIMEOUT)
         return settings
 
 
@@ -512,6 +533,11 @@ class FeaturedProduct(models.Model):
         return True
 
 
+# Cache key for the current attribute definitions version, cleared by products.signals
+# whenever an attribute, option or category link changes
+ATTRIBUTES_VERSION_CACHE_KEY = 'attributes_version'
+
+
 # New models for flexible product attributes system
 class ProductAttribute(models.Model):
     """Defines available attributes for products (e.g., Color, Size, Frame Type)"""
@@ -558,6 +584,9 @@ class ProductAttributeOption(models.Model):
         verbose_name = 'Attribute Option'
         verbose_name_plural = 'Attribute Options'
         ordering = ['sort_order', 'value']
+        indexes = [
+            models.Index(fields=['attribute', 'is_active', 'sort_order']),
+        ]
 
 
 class CategoryAttribute(models.Model):
@@ -573,6 +602,9 @@ class CategoryAttribute(models.Model):
     class Meta:
         unique_together = ['category', 'attribute']
         ordering = ['sort_order']
+        indexes = [
+            models.Index(fields=['category', 'sort_order']),
+        ]
 
 
 class ProductVariant(models.Model):
@@ -0,0 +1,33 @@
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import (
+    Advertisement, ContentSettings, ProductAttribute, ProductAttributeOption, CategoryAttribute,
+    ACTIVE_ADS_CACHE_KEY, CONTENT_SETTINGS_CACHE_KEY, ATTRIBUTES_VERSION_CACHE_KEY
+)
+
+@receiver([post_save, post_delete], sender=Advertisement)
+@receiver([post_save, post_delete], sender=ContentSettings)
+def clear_active_ads_cache(sender, **kwargs):
+    """
+    Signal to drop the cached ads slider payload when ads or content settings change
+    """
+    cache.delete(ACTIVE_ADS_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=ContentSettings)
+def clear_content_settings_cache(sender, **kwargs):
+    """
+    Signal to drop the cached ContentSettings instance when the settings change
+    """
+    cache.delete(CONTENT_SETTINGS_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=ProductAttribute)
+@receiver([post_save, post_delete], sender=ProductAttributeOption)
+@receiver([post_save, post_delete], sender=CategoryAttribute)
+def clear_attributes_version(sender, **kwargs):
+    """
+    Signal to start a new attributes version, so category attribute ETags change
+    """
+    cache.delete(ATTRIBUTES_VERSION_CACHE_KEY)
@@ -127,6 +127,12 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD'),  # No default - must be provided!
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '3306'),
+        # Per-request connections by default: the app is served over ASGI (uvicorn), where
+        # Django runs sync views in per-request threads, so persistent connections are
+        # never reused and accumulate until MySQL hits max_connections. Only raise this
+        # for a WSGI deployment (e.g. gunicorn) with long-lived worker threads.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '0')),
+        'CONN_HEALTH_CHECKS': True,
         'OPTIONS': {
             'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
             'charset': 'utf8mb4',
@@ -275,6 +281,16 @@ CHANNEL_LAYERS = {
     },
 }
 
+# Shared cache on the same Redis server, so every worker process sees the same
+# entries and signal-driven invalidations (db 1 keeps it apart from the channel layer)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': f"redis://{os.getenv('REDIS_HOST', '127.0.0.1')}:{os.getenv('REDIS_PORT', '6379')}/{os.getenv('REDIS_CACHE_DB', '1')}",
+        'KEY_PREFIX': 'to7fa',
+    },
+}
+
 # Push Notification Settings
 FCM_PROJECT_ID = os.getenv('FCM_PROJECT_ID', '')
 FCM_SERVER_KEY = None  # Using service account instead